@@ -6,14 +6,21 @@ computes cryptographic hashes, and validates integrity.
 """
 
 import hashlib
+import mmap
+import random
+import threading
 import time
 import requests
-import json
-from typing import List, Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import UUID
 from models import DiscoveredDocument, AcquiredDocument
+from utils import atomic_write_bytes, ensure_dir, json_dumps
+
+# Leading bytes inspected when validating a downloaded HTML file
+VALIDATION_HEAD_BYTES: int = 2000
 
 
 class ArxivHtmlAcquisition:
@@ -35,6 +42,10 @@ class ArxivHtmlAcquisition:
         self.verbose: bool = verbose
         self.delay_seconds: float = delay_seconds
         self.last_request_time: float = 0.0  # Track last request time for rate limiting
+        # Shared download_timestamp for every document of the current acquire() batch
+        self._batch_timestamp: datetime = datetime.now(timezone.utc)
+        # Set by stop() to end acquire() after the current download
+        self._stop_requested: threading.Event = threading.Event()
         self.session: requests.Session = requests.Session()
         self.session.headers.update(
             {
@@ -42,11 +53,32 @@ class ArxivHtmlAcquisition:
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             }
         )
+        # One keep-alive connection pool reused for every download
+        adapter: HTTPAdapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def __enter__(self) -> "ArxivHtmlAcquisition":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+
+    def stop(self) -> None:
+        """Ask a running acquire() (e.g. on another thread) to return after its current download."""
+        self._stop_requested.set()
 
     def acquire(self, documents: List[DiscoveredDocument]) -> List[AcquiredDocument]:
         """
         Download all discovered documents.
 
+        If stop() is called meanwhile, the remaining documents are skipped and
+        only those attempted so far are returned.
+
         Args:
             documents: List of documents to acquire
 
@@ -54,16 +86,33 @@ class ArxivHtmlAcquisition:
             List of acquisition results
         """
         acquired: List[AcquiredDocument] = []
+        self._batch_timestamp = datetime.now(timezone.utc)
+        progress_bar: Optional[Any] = None
         try:
             from tqdm import tqdm
 
-            docs_iter = tqdm(documents, desc="Acquiring HTML", disable=self.verbose)
+            progress_bar = tqdm(
+                documents,
+                desc="Acquiring HTML",
+                disable=self.verbose,
+                mininterval=0.5,
+            )
+            docs_iter = progress_bar
         except ImportError:
             docs_iter = documents
 
-        for i, doc in enumerate(docs_iter):
+        success_count: int = 0
+        for doc in docs_iter:
+            if self._stop_requested.is_set():
+                break
             result: AcquiredDocument = self._download_document(doc)
             acquired.append(result)
+            if result.download_status == "success":
+                success_count += 1
+                if progress_bar is not None:
+                    progress_bar.set_postfix(successful=success_count, refresh=False)
+        if progress_bar is not None:
+            progress_bar.close()
         return acquired
 
     def _download_document(self, doc: DiscoveredDocument) -> AcquiredDocument:
@@ -79,30 +128,28 @@ class ArxivHtmlAcquisition:
         local_path: Path = self.download_dir / f"{doc.document_id}.html"
 
         # Check if file already exists (skip re-download)
-        if local_path.exists():
-            try:
-                file_size: int = local_path.stat().st_size
-                if file_size > 0:
-                    sha256_hash: str = self._compute_hash(local_path, "sha256")
-                    sha512_hash: str = self._compute_hash(local_path, "sha512")
-                    validation_status: str = self._validate_file(local_path, file_size)
-
-                    if validation_status == "passed":
-                        return AcquiredDocument(
-                            document_id=doc.document_id,
-                            local_path=str(local_path),
-                            file_hash_sha256=sha256_hash,
-                            file_hash_sha512=sha512_hash,
-                            file_size=file_size,
-                            download_timestamp=datetime.now(timezone.utc),
-                            download_status="success",
-                            retry_count=0,
-                            validation_status=validation_status,
-                            arxiv_id=doc.arxiv_id,
-                            arxiv_version=doc.arxiv_version,
-                        )
-            except Exception:
-                pass  # If there's an error reading the file, re-download it
+        try:
+            file_size: int = local_path.stat().st_size
+            if file_size > 0:
+                sha256_hash, sha512_hash = self._compute_hashes(local_path)
+                validation_status: str = self._validate_file(local_path, file_size)
+
+                if validation_status == "passed":
+                    return AcquiredDocument(
+                        document_id=doc.document_id,
+                        local_path=str(local_path),
+                        file_hash_sha256=sha256_hash,
+                        file_hash_sha512=sha512_hash,
+                        file_size=file_size,
+                        download_timestamp=self._batch_timestamp,
+                        download_status="success",
+                        retry_count=0,
+                        validation_status=validation_status,
+                        arxiv_id=doc.arxiv_id,
+                        arxiv_version=doc.arxiv_version,
+                    )
+        except Exception:
+            pass  # Missing or unreadable file: download it
 
         # Construct HTML URL
         # ArXiv HTML URLs are typically: https://arxiv.org/html/{id}v{version}
@@ -121,26 +168,28 @@ class ArxivHtmlAcquisition:
 
         while retry_count < max_retries:
             try:
-                self._download_with_backoff(html_url, local_path, retry_count)
-                file_size: int = local_path.stat().st_size
+                file_size, head = self._download_with_backoff(
+                    html_url, local_path, retry_count
+                )
 
-                # Validate file immediately after download
-                validation_status: str = self._validate_file(local_path, file_size)
+                # Validate the streamed header immediately, without reopening the file
+                validation_status: str = self._validate_content(
+                    head, file_size, local_path.name
+                )
                 if validation_status == "failed":
                     # Delete corrupted file (reCAPTCHA page or error)
                     if local_path.exists():
                         local_path.unlink()
                     raise ValueError(f"Invalid HTML content downloaded")
 
-                sha256_hash: str = self._compute_hash(local_path, "sha256")
-                sha512_hash: str = self._compute_hash(local_path, "sha512")
+                sha256_hash, sha512_hash = self._compute_hashes(local_path)
                 return AcquiredDocument(
                     document_id=doc.document_id,
                     local_path=str(local_path),
                     file_hash_sha256=sha256_hash,
                     file_hash_sha512=sha512_hash,
                     file_size=file_size,
-                    download_timestamp=datetime.now(timezone.utc),
+                    download_timestamp=self._batch_timestamp,
                     download_status="success",
                     retry_count=retry_count,
                     validation_status=validation_status,
@@ -155,7 +204,11 @@ class ArxivHtmlAcquisition:
                     )
 
                 # Check for 404 (HTML not available)
-                if "404 Client Error" in str(e):
+                if (
+                    isinstance(e, requests.HTTPError)
+                    and e.response is not None
+                    and e.response.status_code == 404
+                ):
                     if self.verbose:
                         print(f"[INFO] HTML format not available for {doc.arxiv_id}")
                     return self._create_failed_acquisition(doc, "html_not_available")
@@ -174,9 +227,12 @@ class ArxivHtmlAcquisition:
 
     def _download_with_backoff(
         self, url: str, local_path: Path, retry_count: int
-    ) -> None:
+    ) -> Tuple[int, bytes]:
         """
         Download file with rate limiting - ensures minimum delay between requests.
+
+        Returns:
+            Tuple of (file_size, first VALIDATION_HEAD_BYTES bytes of the body)
         """
         # Enforce minimum delay between ANY requests
         current_time: float = time.time()
@@ -188,9 +244,9 @@ class ArxivHtmlAcquisition:
                 print(f"[RATE LIMIT] Waiting {sleep_time:.1f}s before request...")
             time.sleep(sleep_time)
 
-        # Additional backoff for retries
+        # Additional backoff for retries, with full jitter so retries spread out
         if retry_count > 0:
-            backoff_time: float = min(2**retry_count, 30)
+            backoff_time: float = random.uniform(0, min(2**retry_count, 30))
             if self.verbose:
                 print(
                     f"[RETRY] Additional {backoff_time:.1f}s backoff for retry {retry_count}..."
@@ -199,27 +255,44 @@ class ArxivHtmlAcquisition:
 
         # Make the request
         self.last_request_time = time.time()
-        response: requests.Response = self.session.get(url, timeout=60, stream=True)
+        response: requests.Response = self.session.get(
+            url, timeout=(10, 60), stream=True
+        )
         response.raise_for_status()
 
+        file_size: int = 0
+        head: bytes = b""
         with open(local_path, "wb") as f:
             for chunk in response.iter_content(chunk_size=8192):
                 if chunk:
+                    if len(head) < VALIDATION_HEAD_BYTES:
+                        head += chunk[: VALIDATION_HEAD_BYTES - len(head)]
                     f.write(chunk)
+                    file_size += len(chunk)
+        return file_size, head
+
+    def _compute_hashes(self, file_path: Path) -> Tuple[str, str]:
+        """
+        Compute SHA256 and SHA512 hashes of a file in one pass.
+
+        The file is memory-mapped and handed to both hashers directly, so
+        its contents are never copied into Python bytes objects.
 
-    def _compute_hash(self, file_path: Path, algorithm: str) -> str:
-        """Compute cryptographic hash of file."""
-        hash_obj: Any = hashlib.new(algorithm)
+        Returns:
+            Tuple of (sha256_hex, sha512_hex)
+        """
+        sha256: Any = hashlib.sha256()
+        sha512: Any = hashlib.sha512()
         with open(file_path, "rb") as f:
-            chunk: bytes = f.read(8192)
-            while chunk:
-                hash_obj.update(chunk)
-                chunk = f.read(8192)
-        return hash_obj.hexdigest()
+            if f.seek(0, 2) > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    sha256.update(mm)
+                    sha512.update(mm)
+        return sha256.hexdigest(), sha512.hexdigest()
 
     def _validate_file(self, file_path: Path, file_size: int) -> str:
         """
-        Validate downloaded HTML file.
+        Validate an HTML file already on disk.
 
         Args:
             file_path: Path to downloaded file
@@ -228,33 +301,44 @@ class ArxivHtmlAcquisition:
         Returns:
             Validation status ('passed', 'warning', 'failed')
         """
-        if not file_path.exists():
+        try:
+            with open(file_path, "rb") as f:
+                head: bytes = f.read(VALIDATION_HEAD_BYTES)
+        except FileNotFoundError:
             return "failed"
+        return self._validate_content(head, file_size, file_path.name)
 
+    def _validate_content(self, head: bytes, file_size: int, name: str) -> str:
+        """
+        Validate downloaded HTML from its size and leading bytes.
+
+        Args:
+            head: First bytes of the file
+            file_size: Total file size
+            name: File name used in messages
+
+        Returns:
+            Validation status ('passed', 'warning', 'failed')
+        """
         if file_size < 500:  # Very small files are likely errors
             return "warning"
 
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read(2000)
+        content: str = head.decode("utf-8", errors="ignore")
 
-            # Check for typical indicators of arXiv error pages or captchas
-            if "Access Denied" in content or "Attention Required" in content:
-                if self.verbose:
-                    print(
-                        f"[ERROR] Downloaded CAPTCHA/Error page instead of paper: {file_path.name}"
-                    )
-                return "failed"
+        # Check for typical indicators of arXiv error pages or captchas
+        if "Access Denied" in content or "Attention Required" in content:
+            if self.verbose:
+                print(f"[ERROR] Downloaded CAPTCHA/Error page instead of paper: {name}")
+            return "failed"
 
-            if "not available" in content.lower() and "html" in content.lower():
-                # "HTML not available for this paper" message
-                return "failed"
+        lowered: str = content.lower()
+        if "not available" in lowered and "html" in lowered:
+            # "HTML not available for this paper" message
+            return "failed"
 
-            # Check for HTML tag
-            if (
-                "<html" not in content.lower()
-                and "<!doctype html" not in content.lower()
-            ):
-                return "warning"
+        # Check for HTML tag
+        if "<html" not in lowered and "<!doctype html" not in lowered:
+            return "warning"
 
         return "passed"
 
@@ -268,7 +352,7 @@ class ArxivHtmlAcquisition:
             file_hash_sha256="",
             file_hash_sha512="",
             file_size=0,
-            download_timestamp=datetime.now(timezone.utc),
+            download_timestamp=self._batch_timestamp,
             download_status="failed",
             retry_count=3,
             validation_status=reason,
@@ -302,6 +386,5 @@ class ArxivHtmlAcquisition:
                 for doc in acquired
             ]
         }
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2)
+        ensure_dir(output_path.parent)
+        atomic_write_bytes(output_path, json_dumps(output_data))
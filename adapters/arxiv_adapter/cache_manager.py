@@ -6,13 +6,19 @@ stable IDs and versions, preventing redundant downloads and reprocessing unless
 a new version is available on ArXiv.
 """
 
-import json
+import contextlib
+import functools
 import re
 import hashlib
-from typing import Optional, Dict, Any, Tuple
+import sqlite3
+from typing import Optional, Dict, Any, Tuple, List, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import UUID, uuid5, NAMESPACE_URL
+from utils import has_saved_chunks, json_dumps, json_loads
+
+# arXiv ID and optional version in an abs/pdf URL: 2301.12345v2, hep-ex/0123456v1, ...
+ARXIV_URL_PATTERN = re.compile(r'arxiv\.org/(?:pdf|abs)/([a-zA-Z\-]+/\d+|\d+\.\d+)(v\d+)?')
 
 
 class CacheEntry:
@@ -29,7 +35,9 @@ class CacheEntry:
         source_url: str,
         title: str,
         download_status: str = "success",
-        processing_status: str = "success"
+        processing_status: str = "success",
+        chunk_count: Optional[int] = None,
+        processing_config_hash: Optional[str] = None
     ) -> None:
         """
         Initialize cache entry.
@@ -45,6 +53,8 @@ class CacheEntry:
             title: Paper title
             download_status: Download status ('success', 'failed')
             processing_status: Processing status ('success', 'failed', 'timeout', 'pending')
+            chunk_count: Number of chunks written by the last successful processing run
+            processing_config_hash: Processing config hash of the last successful run
         """
         self.arxiv_id: str = arxiv_id
         self.version: str = version
@@ -56,8 +66,10 @@ class CacheEntry:
         self.title: str = title
         self.download_status: str = download_status
         self.processing_status: str = processing_status
+        self.chunk_count: Optional[int] = chunk_count
+        self.processing_config_hash: Optional[str] = processing_config_hash
     
-    def to_dict(self) -> Dict[str, str]:
+    def to_dict(self) -> Dict[str, Any]:
         """
         Convert cache entry to dictionary.
         
@@ -74,7 +86,9 @@ class CacheEntry:
             'source_url': self.source_url,
             'title': self.title,
             'download_status': self.download_status,
-            'processing_status': self.processing_status
+            'processing_status': self.processing_status,
+            'chunk_count': self.chunk_count,
+            'processing_config_hash': self.processing_config_hash
         }
     
     @staticmethod
@@ -99,46 +113,127 @@ class CacheEntry:
 class CacheManager:
     """Manages cache database for ArXiv papers with version tracking."""
     
-    def __init__(self, cache_dir: Path) -> None:
+    def __init__(self, cache_dir: Path, processing_config_hash: Optional[str] = None) -> None:
         """
         Initialize cache manager.
         
         Args:
             cache_dir: Directory to store cache database
+            processing_config_hash: Hash of the current processing settings; outputs
+                recorded under a different hash are treated as stale
         """
         self.cache_dir: Path = cache_dir
+        self.processing_config_hash: Optional[str] = processing_config_hash
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Legacy JSON cache, imported into the database on first use
         self.cache_file: Path = self.cache_dir / "arxiv_cache.json"
+        self.db_file: Path = self.cache_dir / "arxiv_cache.sqlite"
+        self.connection: sqlite3.Connection = self._connect()
+        # Entries changed inside batch(), written when the outermost batch exits
+        self._batch_depth: int = 0
+        self._pending: Dict[str, CacheEntry] = {}
         self.cache: Dict[str, CacheEntry] = self._load_cache()
     
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the cache database in WAL mode.
+        
+        Returns:
+            Database connection
+        """
+        connection: sqlite3.Connection = sqlite3.connect(str(self.db_file))
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS entries (arxiv_id TEXT PRIMARY KEY, data BLOB NOT NULL)'
+        )
+        return connection
+    
     def _load_cache(self) -> Dict[str, CacheEntry]:
         """
-        Load cache from disk.
+        Load cache from disk, migrating a legacy JSON cache if present.
         
         Returns:
             Dictionary mapping arxiv_id to CacheEntry
         """
-        if not self.cache_file.exists():
-            return {}
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                data: Dict[str, Any] = json.load(f)
-            cache: Dict[str, CacheEntry] = {}
-            for arxiv_id, entry_data in data.items():
-                cache[arxiv_id] = CacheEntry.from_dict(entry_data)
-            return cache
+            rows: List[Tuple[str, bytes]] = self.connection.execute(
+                'SELECT arxiv_id, data FROM entries'
+            ).fetchall()
+            if not rows and self.cache_file.exists():
+                return self._migrate_json_cache()
+            return {
+                arxiv_id: CacheEntry.from_dict(json_loads(data))
+                for arxiv_id, data in rows
+            }
         except Exception as e:
             print(f"Warning: Failed to load cache, starting fresh: {e}")
             return {}
     
-    def _save_cache(self) -> None:
-        """Save cache to disk."""
-        data: Dict[str, Dict[str, str]] = {
-            arxiv_id: entry.to_dict()
-            for arxiv_id, entry in self.cache.items()
+    def _migrate_json_cache(self) -> Dict[str, CacheEntry]:
+        """
+        Import entries from the legacy arxiv_cache.json into the database.
+        
+        The JSON file is renamed with a .migrated suffix afterwards.
+        
+        Returns:
+            Dictionary mapping arxiv_id to CacheEntry
+        """
+        data: Dict[str, Any] = json_loads(self.cache_file.read_bytes())
+        cache: Dict[str, CacheEntry] = {
+            arxiv_id: CacheEntry.from_dict(entry_data)
+            for arxiv_id, entry_data in data.items()
         }
-        with open(self.cache_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        self._save_entries(list(cache.values()))
+        self.cache_file.replace(self.cache_file.with_name(self.cache_file.name + '.migrated'))
+        return cache
+    
+    def _save_entries(self, entries: List[CacheEntry]) -> None:
+        """
+        Upsert entries into the database in a single transaction.
+        
+        Args:
+            entries: Changed cache entries
+        """
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO entries (arxiv_id, data) VALUES (?, ?)',
+                [(entry.arxiv_id, json_dumps(entry.to_dict(), indent=False)) for entry in entries]
+            )
+    
+    def _persist(self, entries: List[CacheEntry]) -> None:
+        """
+        Save changed entries now, or at the end of the enclosing batch().
+        
+        Args:
+            entries: Changed cache entries
+        """
+        if self._batch_depth:
+            for entry in entries:
+                self._pending[entry.arxiv_id] = entry
+        else:
+            self._save_entries(entries)
+    
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer saving entry changes until the block exits, then save them at once.
+        
+        Batches may be nested; only the outermost one writes.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending:
+                entries: List[CacheEntry] = list(self._pending.values())
+                self._pending = {}
+                self._save_entries(entries)
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        self.connection.close()
     
     @staticmethod
     def extract_arxiv_id_and_version(url: str) -> Tuple[Optional[str], Optional[str]]:
@@ -151,25 +246,20 @@ class CacheManager:
         Returns:
             Tuple of (arxiv_id, version) or (None, None) if parsing fails
         """
-        # Match patterns like: 2301.12345v2, 2301.12345, hep-ex/0123456v1, etc.
-        patterns: list[str] = [
-            r'arxiv\.org/(?:pdf|abs)/([a-zA-Z\-]+/\d+|\d+\.\d+)(v\d+)?',
-            r'arxiv\.org/(?:pdf|abs)/([a-zA-Z\-]+/\d+|\d+\.\d+)/?$'
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                arxiv_id: str = match.group(1)
-                version: str = match.group(2) if match.lastindex >= 2 and match.group(2) else 'v1'
-                return arxiv_id, version
+        # Unversioned URLs default to v1
+        match = ARXIV_URL_PATTERN.search(url)
+        if match:
+            return match.group(1), match.group(2) or 'v1'
         return None, None
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def generate_stable_document_id(arxiv_id: str) -> UUID:
         """
         Generate stable UUID for ArXiv paper.
         
         Uses UUID5 with ArXiv ID to ensure same paper always gets same UUID.
+        Results are memoized, since the ID is pure in arxiv_id.
         
         Args:
             arxiv_id: ArXiv paper ID (e.g., '2301.12345')
@@ -181,6 +271,24 @@ class CacheManager:
         arxiv_url: str = f"https://arxiv.org/abs/{arxiv_id}"
         return uuid5(NAMESPACE_URL, arxiv_url)
     
+    def matches_processing_config(self, entry: CacheEntry) -> bool:
+        """
+        Check whether an entry's outputs were produced with the current settings.
+        
+        Entries written before config hashes were recorded are trusted.
+        
+        Args:
+            entry: Cache entry
+            
+        Returns:
+            True if the entry's outputs are current for this configuration
+        """
+        return (
+            self.processing_config_hash is None
+            or entry.processing_config_hash is None
+            or entry.processing_config_hash == self.processing_config_hash
+        )
+    
     def should_download(self, arxiv_id: str, version: str) -> bool:
         """
         Check if paper needs to be downloaded.
@@ -227,16 +335,35 @@ class CacheManager:
             return True
         if file_hash and cached_entry.file_hash_sha256 != file_hash:
             return True
+        if not self.matches_processing_config(cached_entry):
+            return True
         cached_output_dir: Path = Path(cached_entry.output_dir)
         if not cached_output_dir.exists():
             return True
         if not (cached_output_dir / 'document_metadata.json').exists():
             return True
-        chunks_dir: Path = cached_output_dir / 'chunks'
-        if not chunks_dir.exists() or not any(chunks_dir.iterdir()):
+        if not has_saved_chunks(cached_output_dir):
             return True
         return False
     
+    def should_process_many(
+        self,
+        items: List[Tuple[str, str, Optional[str]]]
+    ) -> Dict[str, bool]:
+        """
+        Check a batch of papers for processing in one call.
+        
+        Args:
+            items: (arxiv_id, version, file_hash) tuples
+            
+        Returns:
+            Dictionary mapping arxiv_id to should_process result
+        """
+        return {
+            arxiv_id: self.should_process(arxiv_id, version, file_hash)
+            for arxiv_id, version, file_hash in items
+        }
+    
     def get_cached_entry(self, arxiv_id: str) -> Optional[CacheEntry]:
         """
         Get cached entry for ArXiv ID.
@@ -288,12 +415,13 @@ class CacheManager:
             processing_status=processing_status
         )
         self.cache[arxiv_id] = entry
-        self._save_cache()
+        self._persist([entry])
     
     def update_processing_status(
         self,
         arxiv_id: str,
-        processing_status: str
+        processing_status: str,
+        chunk_count: Optional[int] = None
     ) -> None:
         """
         Update processing status for existing cache entry.
@@ -301,11 +429,40 @@ class CacheManager:
         Args:
             arxiv_id: ArXiv paper ID
             processing_status: New processing status
+            chunk_count: Number of chunks produced (recorded on success)
         """
         if arxiv_id in self.cache:
             self.cache[arxiv_id].processing_status = processing_status
             self.cache[arxiv_id].processing_timestamp = datetime.now(timezone.utc).isoformat()
-            self._save_cache()
+            self.cache[arxiv_id].chunk_count = chunk_count
+            if processing_status == "success":
+                self.cache[arxiv_id].processing_config_hash = self.processing_config_hash
+            self._persist([self.cache[arxiv_id]])
+    
+    def update_processing_status_many(
+        self,
+        updates: List[Tuple[str, str, Optional[int]]]
+    ) -> None:
+        """
+        Update processing status for several entries and save the cache once.
+        
+        Args:
+            updates: (arxiv_id, processing_status, chunk_count) tuples
+        """
+        timestamp: str = datetime.now(timezone.utc).isoformat()
+        changed: List[CacheEntry] = []
+        for arxiv_id, processing_status, chunk_count in updates:
+            entry: Optional[CacheEntry] = self.cache.get(arxiv_id)
+            if entry is None:
+                continue
+            entry.processing_status = processing_status
+            entry.processing_timestamp = timestamp
+            entry.chunk_count = chunk_count
+            if processing_status == "success":
+                entry.processing_config_hash = self.processing_config_hash
+            changed.append(entry)
+        if changed:
+            self._persist(changed)
     
     def get_cache_stats(self) -> Dict[str, int]:
         """
@@ -316,11 +473,11 @@ class CacheManager:
         """
         return {
             'total_papers': len(self.cache),
-            'cache_file_exists': self.cache_file.exists()
+            'cache_file_exists': self.db_file.exists()
         }
     
     def clear_cache(self) -> None:
         """Clear all cache entries."""
         self.cache = {}
-        if self.cache_file.exists():
-            self.cache_file.unlink()
+        with self.connection:
+            self.connection.execute('DELETE FROM entries')
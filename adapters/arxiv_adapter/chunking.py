@@ -6,19 +6,154 @@ accurate token counting, ensuring chunks match the model's constraints.
 Splits documents with configurable overlap, preserving equations, tables, and code blocks.
 """
 
+import functools
+import logging
+from bisect import bisect_right
+from itertools import accumulate
+import os
 import re
-import json
-import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional, Dict, Any
 from pathlib import Path
 from uuid import UUID
 from models import ChunkContent
+from utils import BackgroundWriter, ensure_dir, json_dumps, json_loads, CHUNKS_JSONL_NAME
 
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+# Section headings: lines starting with '##'
+SECTION_HEADING_PATTERN = re.compile(r'^##', re.MULTILINE)
+# Sentence splitting: newline runs are folded to spaces, then split after . ! ?
+NEWLINES_PATTERN = re.compile(r'\n+')
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])\s+')
+# Content features: numbered list items ('1. ') anywhere in the text; heading
+# and bullet line prefixes are checked per line without a regex
+NUMBERED_ITEM_PATTERN = re.compile(r'\d+\.\s')
+# Tokenizers report this sentinel when they define no maximum length
+UNSET_MAX_LENGTH = int(1e30)
+# Cross-document sentence token cache: boilerplate (acknowledgements, standard
+# phrases) recurs across papers; long sentences rarely repeat and are not kept
+SENTENCE_CACHE_SIZE = 50000
+SENTENCE_CACHE_MAX_CHARS = 500
+
+
+@functools.lru_cache(maxsize=4)
+def _load_tokenizer(model_name: str, cache_dir: str) -> Any:
+    """
+    Load a model's tokenizer once per process, without the model weights.
+    
+    Args:
+        model_name: Hugging Face model name
+        cache_dir: Directory to cache downloaded files
+        
+    Returns:
+        Tokenizer for the model
+    """
+    # Imported here so pipeline runs that never tokenize skip loading transformers
+    from transformers import AutoTokenizer
+    # Texts are only counted, never fed to the model, so the warning about
+    # sequences longer than the model's maximum length does not apply
+    logging.getLogger("transformers.tokenization_utils_base").setLevel(logging.ERROR)
+    return AutoTokenizer.from_pretrained(model_name, cache_dir=cache_dir)
+
+
+def _load_model_file_json(model_name: str, cache_dir: str, filename: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a JSON file shipped with a model, from a local model directory or the hub cache.
+    
+    Only a file the model does not have is treated as absent. Network, auth
+    and parse errors, and running offline without a cached copy, propagate so
+    the startup check cannot pass on a model that is not available.
+    
+    Args:
+        model_name: Hugging Face model name or local model directory
+        cache_dir: Directory to cache downloaded files
+        filename: File in the model repository
+        
+    Returns:
+        Parsed JSON, or None if the model has no such file
+    """
+    if os.path.isdir(model_name):
+        path: str = os.path.join(model_name, filename)
+        if not os.path.isfile(path):
+            return None
+    else:
+        # Installed with transformers
+        from huggingface_hub import hf_hub_download
+        from huggingface_hub.utils import EntryNotFoundError, LocalEntryNotFoundError
+        try:
+            path = hf_hub_download(model_name, filename, cache_dir=cache_dir)
+        except LocalEntryNotFoundError:
+            # Offline and not cached: whether the file exists is unknown
+            raise
+        except EntryNotFoundError:
+            return None
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
+
+@functools.lru_cache(maxsize=4)
+def _sentence_transformers_max_seq_length(model_name: str, cache_dir: str) -> Optional[int]:
+    """
+    Get the input length sentence-transformers truncates a model's inputs to.
+    
+    This is max_seq_length in the model's sentence_bert_config.json, which is
+    often shorter than the tokenizer's model_max_length (e.g. 256 vs 512 for
+    all-MiniLM-L6-v2).
+    
+    Args:
+        model_name: Hugging Face model name or local model directory
+        cache_dir: Directory to cache downloaded files
+        
+    Returns:
+        Maximum sequence length, or None if the model has no sentence-transformers config
+    """
+    config: Optional[Dict[str, Any]] = _load_model_file_json(
+        model_name, cache_dir, "sentence_bert_config.json"
+    )
+    max_seq_length: Any = config.get("max_seq_length") if config else None
+    return max_seq_length if isinstance(max_seq_length, int) and max_seq_length > 0 else None
+
+
+def _chunk_size_error(chunk_size: int, max_seq_length: int) -> ValueError:
+    """Build the error raised for a chunk_size the embedding model would truncate."""
+    return ValueError(
+        f"chunk_size ({chunk_size}) exceeds model's max_seq_length ({max_seq_length}). "
+        f"Please set chunk_size <= {max_seq_length} in adapter_config.json"
+    )
+
+
+def check_chunk_size(chunk_size: int, model_name: str, cache_dir: str) -> None:
+    """
+    Check chunk_size against the embedding model's limit without loading its tokenizer.
+    
+    Lets the pipeline fail at startup, before any download, rather than in
+    every worker process that builds a chunker. Reads the same limit as
+    ArxivChunker, with tokenizer_config.json standing in for the tokenizer.
+    Models that ship neither file are left to the chunker's check. Errors
+    fetching the files propagate, so an unreachable model fails here too.
+    
+    Args:
+        chunk_size: Configured chunk size in tokens
+        model_name: Hugging Face model name or local model directory
+        cache_dir: Directory to cache downloaded files
+        
+    Raises:
+        ValueError: If chunk_size exceeds the model's max_seq_length
+    """
+    try:
+        max_seq_length: Optional[int] = _sentence_transformers_max_seq_length(model_name, cache_dir)
+    except ImportError:
+        # Without transformers the chunker counts words and has no limit
+        return
+    if max_seq_length is None:
+        config: Optional[Dict[str, Any]] = _load_model_file_json(
+            model_name, cache_dir, "tokenizer_config.json"
+        )
+        model_max_length: Any = config.get("model_max_length") if config else None
+        if isinstance(model_max_length, (int, float)) and 0 < model_max_length < UNSET_MAX_LENGTH:
+            max_seq_length = int(model_max_length)
+    if max_seq_length is not None and chunk_size > max_seq_length:
+        raise _chunk_size_error(chunk_size, max_seq_length)
 
 
 class ArxivChunker:
@@ -30,7 +165,9 @@ class ArxivChunker:
         chunk_overlap: float = 0.1,
         model_name: str = "BAAI/bge-large-en-v1.5",
         use_model_tokenizer: bool = True,
-        cache_dir: str = ".model_cache"
+        cache_dir: str = ".model_cache",
+        token_count_workers: int = 0,
+        strategy: str = "sentence"
     ) -> None:
         """
         Initialize chunking engine with embedding model.
@@ -38,9 +175,13 @@ class ArxivChunker:
         Args:
             chunk_size: Target chunk size in tokens (must not exceed model's max_seq_length)
             chunk_overlap: Overlap fraction (0 to <1)
-            model_name: Embedding model name from sentence_transformers
+            model_name: Embedding model name on the Hugging Face hub
             use_model_tokenizer: Whether to use model's tokenizer (recommended)
             cache_dir: Directory to cache downloaded models
+            token_count_workers: Threads used to pre-count sentence tokens per
+                document (0 or 1 counts sentences inline while packing)
+            strategy: "sentence" packs whole sentences; "stride" cuts fixed token
+                windows from a single encode of each section
         """
         self.chunk_size: int = chunk_size
         self.chunk_overlap: float = chunk_overlap
@@ -48,35 +189,50 @@ class ArxivChunker:
         self.model_name: str = model_name
         self.use_model_tokenizer: bool = use_model_tokenizer
         self.cache_dir: str = cache_dir
-        self.model: Optional[Any] = None
         self.tokenizer: Optional[Any] = None
         self.max_seq_length: int = 512
+        self.token_count_workers: int = token_count_workers
+        self.strategy: str = strategy
+        # Sentence -> token count for the document being chunked
+        self._sentence_tokens: Dict[str, int] = {}
+        # Sentence -> token count across documents, least recently used first
+        self._sentence_token_cache: "OrderedDict[str, int]" = OrderedDict()
         if use_model_tokenizer:
             self._initialize_model()
             self._validate_chunk_size()
     
     def _initialize_model(self) -> None:
         """
-        Initialize sentence transformer model and extract tokenizer.
+        Load the embedding model's tokenizer.
         
-        This loads the actual embedding model that will be used in the RAG system,
-        ensuring token counts are accurate for the target model. The model's
-        max_seq_length is automatically detected.
+        Uses the tokenizer of the embedding model that will be used in the RAG
+        system, ensuring token counts are accurate for the target model. Only
+        the tokenizer is loaded (the weights are not needed for counting), and
+        it is shared by every chunker in the process. The model's maximum
+        sequence length is the max_seq_length of its sentence-transformers
+        config, falling back to the tokenizer's model_max_length for models
+        without one.
         """
-        if not SENTENCE_TRANSFORMERS_AVAILABLE:
-            print(f"WARNING: sentence-transformers not available, falling back to word-based counting")
-            return
         try:
-            print(f"Loading embedding model: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name, cache_folder=self.cache_dir)
-            self.tokenizer = self.model.tokenizer
-            self.max_seq_length = self.model.get_max_seq_length()
-            print(f"Model loaded successfully. Max sequence length: {self.max_seq_length}")
+            print(f"Loading tokenizer: {self.model_name}")
+            self.tokenizer = _load_tokenizer(self.model_name, self.cache_dir)
+        except ImportError:
+            print(f"WARNING: transformers not available, falling back to word-based counting")
+            return
         except Exception as e:
-            print(f"WARNING: Failed to load model {self.model_name}: {e}")
+            print(f"WARNING: Failed to load tokenizer for {self.model_name}: {e}")
             print("Falling back to word-based counting")
-            self.model = None
             self.tokenizer = None
+            return
+        max_seq_length: Optional[int] = _sentence_transformers_max_seq_length(
+            self.model_name, self.cache_dir
+        )
+        model_max_length: int = self.tokenizer.model_max_length
+        if max_seq_length is not None:
+            self.max_seq_length = max_seq_length
+        elif model_max_length < UNSET_MAX_LENGTH:
+            self.max_seq_length = model_max_length
+        print(f"Tokenizer loaded successfully. Max sequence length: {self.max_seq_length}")
     
     def _validate_chunk_size(self) -> None:
         """
@@ -85,11 +241,8 @@ class ArxivChunker:
         Raises:
             ValueError: If chunk_size exceeds model's max_seq_length
         """
-        if self.model is not None and self.chunk_size > self.max_seq_length:
-            raise ValueError(
-                f"chunk_size ({self.chunk_size}) exceeds model's max_seq_length ({self.max_seq_length}). "
-                f"Please set chunk_size <= {self.max_seq_length} in adapter_config.json"
-            )
+        if self.tokenizer is not None and self.chunk_size > self.max_seq_length:
+            raise _chunk_size_error(self.chunk_size, self.max_seq_length)
     
     def chunk(self, markdown_path: Path, document_id: UUID) -> List[ChunkContent]:
         """
@@ -105,39 +258,63 @@ class ArxivChunker:
         with open(markdown_path, 'r', encoding='utf-8') as f:
             content: str = f.read()
         sections: List[Tuple[str, str]] = self._split_by_sections(content)
-        chunks: List[ChunkContent] = []
-        chunk_index: int = 0
+        # Replaces any table left over from a previous document
+        self._sentence_tokens = (
+            self._precount_sentence_tokens(sections)
+            if self.token_count_workers > 1 and self.tokenizer is not None
+            else {}
+        )
+        # Phase 1: pack every section in order (each carries the previous
+        # section's overlap)
+        packed: List[Tuple[Optional[List[str]], List[str]]] = []
         previous_overlap_text: str = ""
         for section_path, section_text in sections:
             section_chunks: List[str] = self._chunk_section(section_text, previous_overlap_text)
-            for i, chunk_text in enumerate(section_chunks):
-                token_count: int = self._count_tokens(chunk_text)
-                chunk: ChunkContent = ChunkContent(
-                    chunk_id=uuid.uuid4(),
+            if section_chunks:
+                # The section_path list is shared by every chunk of the section
+                packed.append(([section_path] if section_path else None, section_chunks))
+                previous_overlap_text = self._extract_overlap(section_chunks[-1])
+        self._sentence_tokens = {}
+        # Phase 2: finalize all chunks together; one batched tokenizer call
+        # counts every chunk, and the totals are known up front
+        token_counts: List[int] = self._count_chunks_tokens(
+            [chunk_text for _, section_chunks in packed for chunk_text in section_chunks]
+        )
+        total_chunks: int = len(token_counts)
+        last_index: int = total_chunks - 1
+        analyze_chunk = self._analyze_chunk
+        # Random bits for every chunk ID in one read; same as uuid.uuid4() per chunk
+        id_bytes: bytes = os.urandom(16 * total_chunks)
+        chunks: List[ChunkContent] = []
+        chunk_index: int = 0
+        for section_path_list, section_chunks in packed:
+            for chunk_text in section_chunks:
+                chunk_type, content_features = analyze_chunk(chunk_text)
+                id_offset: int = 16 * chunk_index
+                chunks.append(ChunkContent(
+                    chunk_id=UUID(bytes=id_bytes[id_offset:id_offset + 16], version=4),
                     document_id=document_id,
                     chunk_index=chunk_index,
-                    total_chunks=0,
+                    total_chunks=total_chunks,
                     content=chunk_text,
-                    token_count=token_count,
-                    chunk_type=self._detect_chunk_type(chunk_text),
-                    section_path=[section_path] if section_path else None,
-                    has_overlap_previous=(i > 0 or chunk_index > 0),
-                    has_overlap_next=(i < len(section_chunks) - 1),
-                    content_features=self._extract_features(chunk_text)
-                )
-                chunks.append(chunk)
+                    token_count=token_counts[chunk_index],
+                    chunk_type=chunk_type,
+                    section_path=section_path_list,
+                    has_overlap_previous=(chunk_index > 0),
+                    has_overlap_next=(chunk_index < last_index),
+                    content_features=content_features,
+                    character_count=len(chunk_text)
+                ))
                 chunk_index += 1
-                if section_chunks:
-                    previous_overlap_text = self._extract_overlap(section_chunks[-1])
-        for chunk in chunks:
-            chunk.total_chunks = len(chunks)
-            chunk.has_overlap_next = (chunk.chunk_index < len(chunks) - 1)
         return chunks
     
     def _split_by_sections(self, content: str) -> List[Tuple[str, str]]:
         """
         Split content by markdown sections.
         
+        Sections are sliced directly out of the content at heading offsets,
+        rather than splitting the whole document into lines and re-joining.
+        
         Args:
             content: Markdown content
             
@@ -145,20 +322,45 @@ class ArxivChunker:
             List of (section_path, section_text) tuples
         """
         sections: List[Tuple[str, str]] = []
-        lines: List[str] = content.split('\n')
-        current_section: str = "Document"
-        current_text: List[str] = []
-        for line in lines:
-            if line.startswith('##'):
-                if current_text:
-                    sections.append((current_section, '\n'.join(current_text)))
-                    current_text = []
-                current_section = line.lstrip('#').strip()
-            current_text.append(line)
-        if current_text:
-            sections.append((current_section, '\n'.join(current_text)))
+        starts: List[int] = [m.start() for m in SECTION_HEADING_PATTERN.finditer(content)]
+        if not starts or starts[0] > 0:
+            # Text before the first heading (drop the newline ending it)
+            end: int = starts[0] - 1 if starts else len(content)
+            sections.append(("Document", content[:end]))
+        for i, start in enumerate(starts):
+            end = starts[i + 1] - 1 if i + 1 < len(starts) else len(content)
+            heading_end: int = content.find('\n', start, end)
+            if heading_end == -1:
+                heading_end = end
+            sections.append((content[start:heading_end].lstrip('#').strip(), content[start:end]))
         return sections
     
+    def _precount_sentence_tokens(self, sections: List[Tuple[str, str]]) -> Dict[str, int]:
+        """
+        Count tokens for every distinct sentence of a document on a thread pool.
+        
+        Sections are packed sequentially (each carries the previous section's
+        overlap), but their sentences can be tokenized up front; the fast
+        tokenizers release the GIL while encoding. Sentences formed across a
+        section boundary are not in the result and are counted inline.
+        
+        Args:
+            sections: (section_path, section_text) tuples
+            
+        Returns:
+            Mapping of sentence to token count
+        """
+        sentences: List[str] = list({
+            sentence
+            for _, section_text in sections
+            for sentence in self._split_sentences(section_text)
+        })
+        with ThreadPoolExecutor(max_workers=self.token_count_workers) as pool:
+            counts: List[int] = list(
+                pool.map(self._count_sentence_tokens_safely, sentences, chunksize=64)
+            )
+        return dict(zip(sentences, counts))
+    
     def _chunk_section(self, text: str, previous_overlap: str) -> List[str]:
         """
         Chunk a section into token-sized pieces.
@@ -172,21 +374,77 @@ class ArxivChunker:
         """
         if previous_overlap:
             text = previous_overlap + "\n\n" + text
+        if self.strategy == "stride":
+            windows: Optional[List[str]] = self._chunk_section_stride(text)
+            if windows is not None:
+                return windows
         sentences: List[str] = self._split_sentences(text)
+        if not sentences:
+            return []
+        # Join the section once; each chunk, being a run of consecutive
+        # sentences joined by spaces, is then a single slice of it
+        joined: str = ' '.join(sentences)
+        # Token counts are kept per sentence, so the overlap carried into the
+        # next chunk is never re-tokenized
+        sentence_counts: List[int] = self._count_sentences_tokens(sentences)
+        # A section that fits is a single chunk; skip the packing loop
+        if sum(sentence_counts) <= self.chunk_size:
+            return [joined]
+        # Offset of each sentence in joined, and running token totals
+        starts: List[int] = list(accumulate((len(s) + 1 for s in sentences), initial=0))
+        totals: List[int] = list(accumulate(sentence_counts, initial=0))
+        sentence_count: int = len(sentences)
         chunks: List[str] = []
-        current_chunk: List[str] = []
-        current_tokens: int = 0
-        for sentence in sentences:
-            sentence_tokens: int = self._count_sentence_tokens_safely(sentence)
-            if current_tokens + sentence_tokens > self.chunk_size and current_chunk:
-                chunks.append(' '.join(current_chunk))
-                overlap_sentences: List[str] = self._get_overlap_sentences(current_chunk)
-                current_chunk = overlap_sentences
-                current_tokens = sum(self._count_sentence_tokens_safely(s) for s in overlap_sentences)
-            current_chunk.append(sentence)
-            current_tokens += sentence_tokens
-        if current_chunk:
-            chunks.append(' '.join(current_chunk))
+        first: int = 0
+        end: int = 0
+        # Loop-invariant attribute lookups, bound once per section
+        chunk_size: int = self.chunk_size
+        overlap_start_of = self._overlap_start
+        while True:
+            # A chunk takes sentences while they fit in chunk_size, found by
+            # bisecting the running totals instead of adding one sentence at a
+            # time; it always takes at least one sentence past the overlap
+            end = max(end + 1, bisect_right(totals, totals[first] + chunk_size) - 1)
+            if end >= sentence_count:
+                chunks.append(joined[starts[first]:])
+                return chunks
+            chunks.append(joined[starts[first]:starts[end] - 1])
+            first = overlap_start_of(sentence_counts, first, end)
+    
+    def _chunk_section_stride(self, text: str) -> Optional[List[str]]:
+        """
+        Chunk a section into fixed token windows with a single tokenizer call.
+        
+        Windows hold chunk_size tokens and start every chunk_size - overlap
+        tokens. Token character offsets map each window back to a slice of the
+        original text, so no text is decoded or tokenized again.
+        
+        Args:
+            text: Section text, including any overlap from the previous section
+            
+        Returns:
+            List of chunk strings, or None if the tokenizer cannot report offsets
+        """
+        if self.tokenizer is None:
+            return None
+        try:
+            offsets: List[Tuple[int, int]] = self.tokenizer(
+                text,
+                add_special_tokens=False,
+                truncation=False,
+                return_offsets_mapping=True
+            )['offset_mapping']
+        except Exception:
+            # Slow (non-Rust) tokenizers do not provide offsets
+            return None
+        chunk_size: int = self.chunk_size
+        stride: int = max(1, chunk_size - self.overlap_tokens)
+        chunks: List[str] = []
+        for start in range(0, len(offsets), stride):
+            window: List[Tuple[int, int]] = offsets[start:start + chunk_size]
+            chunks.append(text[window[0][0]:window[-1][1]])
+            if start + chunk_size >= len(offsets):
+                break
         return chunks
     
     def _split_sentences(self, text: str) -> List[str]:
@@ -199,9 +457,9 @@ class ArxivChunker:
         Returns:
             List of sentences
         """
-        text = re.sub(r'\n+', ' ', text)
-        sentences: List[str] = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        text = NEWLINES_PATTERN.sub(' ', text)
+        # Strip each piece once, lazily, rather than stripping twice per piece
+        return [s for s in map(str.strip, SENTENCE_BOUNDARY_PATTERN.split(text)) if s]
     
     def _get_overlap_sentences(self, sentences: List[str]) -> List[str]:
         """
@@ -213,15 +471,44 @@ class ArxivChunker:
         Returns:
             Sentences to include in overlap
         """
-        overlap_sents: List[str] = []
+        # Walk back to the first overlap sentence and slice once, instead of
+        # inserting each sentence at the front of a list
+        start: int = len(sentences)
         overlap_count: int = 0
-        for sentence in reversed(sentences):
-            sent_tokens: int = self._count_sentence_tokens_safely(sentence)
-            if overlap_count + sent_tokens > self.overlap_tokens:
+        overlap_tokens: int = self.overlap_tokens
+        count_sentence_tokens = self._count_sentence_tokens_safely
+        while start > 0:
+            sent_tokens: int = count_sentence_tokens(sentences[start - 1])
+            if overlap_count + sent_tokens > overlap_tokens:
                 break
-            overlap_sents.insert(0, sentence)
             overlap_count += sent_tokens
-        return overlap_sents
+            start -= 1
+        return sentences[start:]
+    
+    def _overlap_start(self, token_counts: List[int], first: int, end: int) -> int:
+        """
+        Find where the overlap begins from per-sentence token counts.
+        
+        Same selection as _get_overlap_sentences, without counting tokens again.
+        
+        Args:
+            token_counts: Token count of each sentence in the section
+            first: Index of the chunk's first sentence
+            end: Index one past the chunk's last sentence
+            
+        Returns:
+            Index of the first sentence to carry over as overlap (end if none)
+        """
+        start: int = end
+        overlap_count: int = 0
+        overlap_tokens: int = self.overlap_tokens
+        while start > first:
+            sent_tokens: int = token_counts[start - 1]
+            if overlap_count + sent_tokens > overlap_tokens:
+                break
+            overlap_count += sent_tokens
+            start -= 1
+        return start
     
     def _extract_overlap(self, chunk_text: str) -> str:
         """
@@ -241,7 +528,6 @@ class ArxivChunker:
         """
         Count tokens in text using the embedding model's tokenizer.
         
-        Uses safe batched processing to prevent memory issues with large texts.
         This ensures accurate token counts matching the actual embedding model.
         
         Args:
@@ -259,10 +545,11 @@ class ArxivChunker:
     
     def _count_tokens_safely(self, text: str) -> int:
         """
-        Count tokens safely by processing in batches to avoid memory issues.
+        Count tokens with a single tokenizer call, falling back to word count.
         
-        Critical for handling large documents (161K+ tokens) that would cause
-        memory errors if tokenized all at once. Processes in 10KB character batches.
+        Fast tokenizers encode whole chunks in one call; splitting the text
+        into character batches only added calls and miscounted tokens cut at
+        batch boundaries.
         
         Args:
             text: Input text
@@ -272,34 +559,17 @@ class ArxivChunker:
         """
         if not text:
             return 0
-        max_batch_size: int = 10000
-        if len(text) <= max_batch_size:
-            try:
-                tokens = self.tokenizer.encode(
-                    text,
-                    add_special_tokens=False,
-                    truncation=False,
-                    max_length=None
-                )
-                return len(tokens)
-            except Exception as e:
-                print(f"WARNING: Tokenization failed for short text: {e}")
-                return len(text.split())
-        total_tokens: int = 0
-        for i in range(0, len(text), max_batch_size):
-            batch: str = text[i:i + max_batch_size]
-            try:
-                tokens = self.tokenizer.encode(
-                    batch,
-                    add_special_tokens=False,
-                    truncation=False,
-                    max_length=None
-                )
-                total_tokens += len(tokens)
-            except Exception as e:
-                print(f"WARNING: Batch tokenization failed: {e}, using word count")
-                total_tokens += len(batch.split())
-        return total_tokens
+        try:
+            tokens = self.tokenizer.encode(
+                text,
+                add_special_tokens=False,
+                truncation=False,
+                max_length=None
+            )
+            return len(tokens)
+        except Exception as e:
+            print(f"WARNING: Tokenization failed: {e}, using word count")
+            return len(text.split())
     
     def _count_sentence_tokens_safely(self, sentence: str) -> int:
         """
@@ -313,6 +583,9 @@ class ArxivChunker:
         """
         if not sentence:
             return 0
+        cached: Optional[int] = self._sentence_tokens.get(sentence)
+        if cached is not None:
+            return cached
         if self.tokenizer is not None:
             try:
                 tokens = self.tokenizer.encode(
@@ -326,18 +599,113 @@ class ArxivChunker:
                 pass
         return len(sentence.split())
     
-    def _detect_chunk_type(self, text: str) -> str:
+    def _count_sentences_tokens(self, sentences: List[str]) -> List[int]:
+        """
+        Count tokens for a list of sentences in one batched tokenizer call.
+        
+        Sentences seen in earlier documents are served from a bounded LRU
+        cache; the rest go through a single call into the fast tokenizer
+        instead of one encode() per sentence. Falls back to counting each
+        sentence on its own when sentences were pre-counted, there is no
+        tokenizer, or the batch fails.
+        
+        Args:
+            sentences: Input sentences
+            
+        Returns:
+            Token count for each sentence
+        """
+        if self.tokenizer is None:
+            return [self._count_sentence_tokens_safely(sentence) for sentence in sentences]
+        cache: "OrderedDict[str, int]" = self._sentence_token_cache
+        counts: List[int] = []
+        misses: List[str] = []
+        for sentence in sentences:
+            cached: Optional[int] = cache.get(sentence)
+            if cached is None:
+                misses.append(sentence)
+                counts.append(-1)
+            else:
+                cache.move_to_end(sentence)
+                counts.append(cached)
+        if not misses:
+            return counts
+        miss_counts: Optional[List[int]] = None
+        if not self._sentence_tokens:
+            miss_counts = self._batch_token_counts(misses)
+        if miss_counts is None:
+            miss_counts = [self._count_sentence_tokens_safely(sentence) for sentence in misses]
+        found: Dict[str, int] = dict(zip(misses, miss_counts))
+        for sentence, count in found.items():
+            if len(sentence) <= SENTENCE_CACHE_MAX_CHARS:
+                cache[sentence] = count
+        while len(cache) > SENTENCE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return [found[sentence] if count < 0 else count for sentence, count in zip(sentences, counts)]
+    
+    def _count_chunks_tokens(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens for all chunk texts of a document in one batched tokenizer call.
+        
+        The fast tokenizer encodes a batch on its own thread pool, outside the
+        GIL. Falls back to counting each text on its own.
+        
+        Args:
+            texts: Chunk texts
+            
+        Returns:
+            Token count for each text
+        """
+        counts: Optional[List[int]] = self._batch_token_counts(texts)
+        if counts is not None:
+            return counts
+        return [self._count_tokens(text) for text in texts]
+    
+    def _batch_token_counts(self, texts: List[str]) -> Optional[List[int]]:
+        """
+        Encode texts in a single tokenizer call and return their token counts.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            Token count for each text, or None without a tokenizer or on failure
+        """
+        if self.tokenizer is None or not texts:
+            return None
+        try:
+            encoded = self.tokenizer(texts, add_special_tokens=False, truncation=False)
+            return [len(ids) for ids in encoded['input_ids']]
+        except Exception:
+            return None
+    
+    def _analyze_chunk(self, text: str) -> Tuple[str, Dict[str, int]]:
+        """
+        Detect chunk type and extract content features in one pass over the chunk.
+        
+        Args:
+            text: Chunk text
+            
+        Returns:
+            Tuple of (chunk_type, content_features)
+        """
+        features: Dict[str, int] = self._extract_features(text)
+        return self._detect_chunk_type(text, features), features
+    
+    def _detect_chunk_type(self, text: str, features: Dict[str, int]) -> str:
         """
         Detect primary content type of chunk.
         
         Args:
             text: Chunk text
+            features: Content features of the chunk, reused instead of rescanning
             
         Returns:
             Chunk type ('text', 'table', 'equation', 'mixed')
         """
-        has_table: bool = '|' in text and '---' in text
-        has_equation: bool = '$$' in text or '$' in text
+        # A '|---' table rule implies both '|' and '---'
+        has_table: bool = features["table_count"] > 0 or ('|' in text and '---' in text)
+        has_equation: bool = features["equation_count"] > 0
         if has_table and has_equation:
             return "mixed"
         if has_table:
@@ -356,40 +724,93 @@ class ArxivChunker:
         Returns:
             Feature counts
         """
+        # Headings are '#'+ and bullets '*', '-' or '+', followed by whitespace
+        # (or the line's own newline) at the start of a line
+        heading_count: int = 0
+        list_count: int = len(NUMBERED_ITEM_PATTERN.findall(text))
+        lines: List[str] = text.split('\n')
+        last: int = len(lines) - 1
+        for i, line in enumerate(lines):
+            first: str = line[:1]
+            if first == '#':
+                rest: str = line.lstrip('#')
+                if rest[:1].isspace() or (not rest and i < last):
+                    heading_count += 1
+            elif first and first in '*-+':
+                if line[1:2].isspace() or (len(line) == 1 and i < last):
+                    list_count += 1
         return {
-            "heading_count": len(re.findall(r'^#+\s', text, re.MULTILINE)),
-            "list_count": len(re.findall(r'^[\*\-\+]\s|\d+\.\s', text, re.MULTILINE)),
+            "heading_count": heading_count,
+            "list_count": list_count,
             "table_count": text.count('|---'),
             "equation_count": text.count('$$') + text.count('$')
         }
     
-    def save_chunks(self, chunks: List[ChunkContent], output_dir: Path) -> None:
+    @staticmethod
+    def save_chunks(
+        chunks: List[ChunkContent],
+        output_dir: Path,
+        writer: Optional[BackgroundWriter] = None,
+        chunks_format: str = "files",
+        indent: bool = True
+    ) -> None:
         """
         Save chunks to individual files with metadata.
         
+        With chunks_format "jsonl", all chunks are instead written to a single
+        chunks.jsonl in output_dir, one {"metadata": ..., "content": ...}
+        object per line.
+        
         Args:
             chunks: List of chunks
             output_dir: Output directory
+            writer: Optional background writer; files are written inline without one
+            chunks_format: "files" (chunk_NNNN.md + metadata JSON) or "jsonl"
+            indent: Pretty-print chunk metadata files; JSONL lines are always compact
         """
+        jsonl: bool = chunks_format == "jsonl"
         chunks_dir: Path = output_dir / "chunks"
-        chunks_dir.mkdir(parents=True, exist_ok=True)
+        if not jsonl:
+            ensure_dir(chunks_dir)
+        if not chunks:
+            return
+        # Identical for every chunk of the document
+        document_id: str = str(chunks[0].document_id)
+        total_chunks: int = len(chunks)
+        lines: List[bytes] = []
         for chunk in chunks:
-            chunk_num: str = f"{chunk.chunk_index + 1:04d}"
-            content_path: Path = chunks_dir / f"chunk_{chunk_num}.md"
-            with open(content_path, 'w', encoding='utf-8') as f:
-                f.write(chunk.content)
-            metadata_path: Path = chunks_dir / f"chunk_{chunk_num}_metadata.json"
             metadata: Dict[str, Any] = {
                 "chunk_id": str(chunk.chunk_id),
-                "document_id": str(chunk.document_id),
+                "document_id": document_id,
                 "chunk_index": chunk.chunk_index,
-                "total_chunks": chunk.total_chunks,
+                "total_chunks": total_chunks,
                 "token_count": chunk.token_count,
+                "character_count": chunk.character_count,
                 "chunk_type": chunk.chunk_type,
                 "section_path": chunk.section_path,
                 "has_overlap_previous": chunk.has_overlap_previous,
                 "has_overlap_next": chunk.has_overlap_next,
                 "content_features": chunk.content_features
             }
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+            if jsonl:
+                record: Dict[str, Any] = {"metadata": metadata, "content": chunk.content}
+                lines.append(json_dumps(record, indent=False))
+                continue
+            chunk_num: str = f"{chunk.chunk_index + 1:04d}"
+            content_path: Path = chunks_dir / f"chunk_{chunk_num}.md"
+            metadata_path: Path = chunks_dir / f"chunk_{chunk_num}_metadata.json"
+            content_bytes: bytes = chunk.content.encode('utf-8')
+            metadata_bytes: bytes = json_dumps(metadata, indent)
+            if writer is not None:
+                writer.write(content_path, content_bytes)
+                writer.write(metadata_path, metadata_bytes)
+            else:
+                content_path.write_bytes(content_bytes)
+                metadata_path.write_bytes(metadata_bytes)
+        if jsonl:
+            jsonl_path: Path = output_dir / CHUNKS_JSONL_NAME
+            jsonl_bytes: bytes = b'\n'.join(lines) + b'\n'
+            if writer is not None:
+                writer.write(jsonl_path, jsonl_bytes)
+            else:
+                jsonl_path.write_bytes(jsonl_bytes)
@@ -10,6 +10,7 @@ import hashlib
 from pathlib import Path
 from typing import Dict, Any
 from models import AdapterConfig
+from utils import atomic_write_bytes
 
 
 class ConfigManager:
@@ -24,6 +25,9 @@ class ConfigManager:
         """
         self.config_path: Path = config_path
         self.config: AdapterConfig = self._load_config()
+        # Looked up once; every getter reads from these
+        self.processing_config: Dict[str, Any] = self.config.processing_config
+        self.embedding_config: Dict[str, Any] = self.config.embedding_config or {}
 
     def _load_config(self) -> AdapterConfig:
         """
@@ -74,64 +78,118 @@ class ConfigManager:
             config: Configuration to save
         """
         data: Dict[str, Any] = {"adapter_config": config.model_dump()}
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        atomic_write_bytes(
+            self.config_path, json.dumps(data, indent=2, default=str).encode("utf-8")
+        )
+
+    def get_processing_config_hash(self) -> str:
+        """
+        Get a short hash of the settings that determine processed output.
+
+        Only settings that change the markdown, chunks, chunk file layout or
+        document metadata are covered, read through their getters so an
+        explicit default hashes the same as an absent key. Performance and
+        logging settings (workers, timeouts, log_level, JSON formatting, model
+        cache directory) are left out, so changing them keeps cached outputs
+        valid.
+
+        Returns:
+            16-character hexadecimal hash string
+        """
+        settings: Dict[str, Any] = {
+            "chunk_size": self.get_chunk_size(),
+            "chunk_overlap": self.get_chunk_overlap(),
+            "chunking_strategy": self.get_chunking_strategy(),
+            "chunks_format": self.get_chunks_format(),
+            "preserve_tables": self.processing_config.get("preserve_tables"),
+            "table_mode": self.get_table_mode(),
+            "preserve_equations": self.processing_config.get("preserve_equations"),
+            "exclude_references": self.get_exclude_references(),
+            "exclude_acknowledgments": self.get_exclude_acknowledgments(),
+            "exclude_author_lists": self.get_exclude_author_lists(),
+            "include_authors_metadata": self.get_include_authors_metadata(),
+            "model_name": self.get_embedding_model_name(),
+            "use_model_tokenizer": self.get_use_model_tokenizer(),
+        }
+        canonical_json: str = json.dumps(settings, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()[:16]
 
     def get_chunk_size(self) -> int:
         """Get configured chunk size in tokens."""
-        return self.config.processing_config["chunk_size"]
+        return self.processing_config["chunk_size"]
 
     def get_chunk_overlap(self) -> float:
         """Get configured chunk overlap as fraction."""
-        return self.config.processing_config["chunk_overlap"]
+        return self.processing_config["chunk_overlap"]
 
     def get_preserve_tables(self) -> bool:
         """Get table preservation setting."""
-        return self.config.processing_config["preserve_tables"]
+        return self.processing_config["preserve_tables"]
 
     def get_preserve_equations(self) -> bool:
         """Get equation preservation setting."""
-        return self.config.processing_config["preserve_equations"]
+        return self.processing_config["preserve_equations"]
 
     def get_enrich_formulas(self) -> bool:
         """Get formula enrichment setting."""
-        return self.config.processing_config.get("enrich_formulas", True)
+        return self.processing_config.get("enrich_formulas", True)
 
     def get_exclude_references(self) -> bool:
         """Get reference exclusion setting."""
-        return self.config.processing_config.get("exclude_references", True)
+        return self.processing_config.get("exclude_references", True)
 
     def get_exclude_acknowledgments(self) -> bool:
         """Get acknowledgments exclusion setting."""
-        return self.config.processing_config.get("exclude_acknowledgments", True)
+        return self.processing_config.get("exclude_acknowledgments", True)
 
     def get_exclude_author_lists(self) -> bool:
         """Get author list exclusion setting."""
-        return self.config.processing_config.get("exclude_author_lists", True)
+        return self.processing_config.get("exclude_author_lists", True)
 
     def get_include_authors_metadata(self) -> bool:
         """Get whether to include authors in metadata."""
-        return self.config.processing_config.get("include_authors_metadata", False)
+        return self.processing_config.get("include_authors_metadata", False)
 
     def get_embedding_model_name(self) -> str:
         """Get embedding model name."""
-        embedding_config = self.config.embedding_config or {}
-        return embedding_config.get("model_name", "BAAI/bge-large-en-v1.5")
+        return self.embedding_config.get("model_name", "BAAI/bge-large-en-v1.5")
 
     def get_use_model_tokenizer(self) -> bool:
         """Get whether to use the embedding model's tokenizer."""
-        embedding_config = self.config.embedding_config or {}
-        return embedding_config.get("use_model_tokenizer", True)
+        return self.embedding_config.get("use_model_tokenizer", True)
 
     def get_model_cache_dir(self) -> str:
         """Get model cache directory."""
-        embedding_config = self.config.embedding_config or {}
-        return embedding_config.get("cache_dir", ".model_cache")
+        return self.embedding_config.get("cache_dir", ".model_cache")
+
+    def get_token_count_workers(self) -> int:
+        """Get threads used to pre-count sentence tokens per document (0 = off)."""
+        return self.processing_config.get("token_count_workers", 0)
+
+    def get_chunking_strategy(self) -> str:
+        """Get chunk boundary strategy ('sentence' or 'stride')."""
+        return self.processing_config.get("chunking_strategy", "sentence")
+
+    def get_max_workers(self) -> int:
+        """Get process pool size for conversion and chunking (0 = CPU count)."""
+        return self.processing_config.get("max_workers", 0)
+
+    def get_log_level(self) -> str:
+        """Get minimum level recorded in processing_log.json (default records everything)."""
+        return self.processing_config.get("log_level", "DEBUG")
 
     def get_processing_timeout(self) -> int:
         """Get processing timeout in seconds (0 = no timeout)."""
-        return self.config.processing_config.get("processing_timeout", 100)
+        return self.processing_config.get("processing_timeout", 100)
+
+    def get_chunks_format(self) -> str:
+        """Get chunk output format ('files' or 'jsonl')."""
+        return self.processing_config.get("chunks_format", "files")
+
+    def get_pretty_json(self) -> bool:
+        """Get whether per-document JSON outputs are pretty-printed."""
+        return self.processing_config.get("pretty_json", False)
 
     def get_table_mode(self) -> str:
         """Get table processing mode ('fast' or 'accurate')."""
-        return self.config.processing_config.get("table_mode", "fast")
+        return self.processing_config.get("table_mode", "fast")
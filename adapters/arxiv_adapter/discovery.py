@@ -5,37 +5,101 @@ Uses the arXiv API to search for High-Energy Physics papers
 and generates discovery output compliant with HEPilot schema.
 """
 
+import logging
 import uuid
-import json
 import requests
+from requests.adapters import HTTPAdapter
 import xml.etree.ElementTree as ET
 import time
-from typing import List, Optional, Dict, Any, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple, Iterator, Iterable, Set
 from datetime import datetime, timezone
 from pathlib import Path
 from models import DiscoveredDocument
+from utils import atomic_write_bytes, ensure_dir, json_dumps
 from cache_manager import CacheManager
 
+ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
+OPENSEARCH_NAMESPACE = "http://a9.com/-/spec/opensearch/1.1/"
+# Clark-notation tags matched while stream-parsing a results page
+ATOM_ENTRY_TAG = f"{{{ATOM_NAMESPACE}}}entry"
+OPENSEARCH_TOTAL_RESULTS_TAG = f"{{{OPENSEARCH_NAMESPACE}}}totalResults"
+# Entry children, looked up directly by tag rather than through a prefix map
+ATOM_TITLE_TAG = f"{{{ATOM_NAMESPACE}}}title"
+ATOM_ID_TAG = f"{{{ATOM_NAMESPACE}}}id"
+ATOM_LINK_TAG = f"{{{ATOM_NAMESPACE}}}link"
+ATOM_AUTHOR_TAG = f"{{{ATOM_NAMESPACE}}}author"
+ATOM_NAME_TAG = f"{{{ATOM_NAMESPACE}}}name"
+# Bytes read from the response per parser feed
+STREAM_CHUNK_SIZE = 65536
+# Responses that mean the API is throttling or overloaded; the page is retried
+THROTTLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
 
 class ArxivDiscovery:
     """Discovers HEP papers from arXiv API."""
     
-    def __init__(self, max_results: Optional[int] = None, include_authors: bool = False) -> None:
+    def __init__(
+        self,
+        max_results: Optional[int] = None,
+        include_authors: bool = False,
+        session: Optional[requests.Session] = None
+    ) -> None:
         """
         Initialize ArXiv discovery module.
         
         Args:
             max_results: Maximum number of papers to discover (None for All)
             include_authors: Whether to include author lists in discovery output
+            session: Optional shared HTTP session; it is left open by close()
         """
         self.max_results: Optional[int] = max_results
         self.include_authors: bool = include_authors
+        self.logger: logging.Logger = logging.getLogger(__name__)
         self.api_url: str = "https://export.arxiv.org/api/query"
         self.page_size: int = 100
+        # Gap between requests: doubled when throttled, eased back towards the
+        # floor after each success. arXiv asks for at most one request per 3 s.
         self.delay_seconds: float = 4.0
+        self.min_delay_seconds: float = 3.0
+        self.max_delay_seconds: float = 60.0
+        self.max_retries: int = 3
         self.last_request_time: float = 0.0  # Track last request time for rate limiting
-        self.session: requests.Session = requests.Session()
-        self.session.headers.update({"User-Agent": "HEPilot-ArXiv-Adapter/1.0"})
+        # Shared by every document of the current search
+        self._discovery_timestamp: Optional[datetime] = None
+        self._owns_session: bool = session is None
+        self.session: requests.Session = session if session is not None else self._create_session()
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create the HTTP session used for API requests.
+        
+        Returns:
+            Session with one keep-alive connection that asks for compressed responses
+        """
+        session: requests.Session = requests.Session()
+        # The Atom feed is verbose XML; ask for it compressed
+        session.headers.update({
+            "User-Agent": "HEPilot-ArXiv-Adapter/1.0",
+            "Accept-Encoding": "gzip, deflate",
+        })
+        # One keep-alive connection to the API reused for every page
+        adapter: HTTPAdapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def __enter__(self) -> "ArxivDiscovery":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections, unless it was passed in."""
+        if self._owns_session:
+            self.session.close()
     
     def search(self, query: str = "all:lhcb") -> List[DiscoveredDocument]:
         """
@@ -47,53 +111,103 @@ class ArxivDiscovery:
         Returns:
             List of discovered documents
         """
-        discovered: List[DiscoveredDocument] = []
-        start: int = 0
-        total_fetched: int = 0
+        return list(self.iter_search(query))
+    
+    def iter_search(self, query: str = "all:lhcb") -> Iterator[DiscoveredDocument]:
+        """
+        Search arXiv for papers matching query, yielding each document as its page is parsed.
         
-        while True:
-            if self.max_results and total_fetched >= self.max_results:
-                break
-            
-            results, total_results = self._fetch_page(query, start)
-            
-            if not results:
-                break
-            
-            for result in results:
-                if self.max_results and total_fetched >= self.max_results:
-                    break
-                    
-                if self._is_redacted_entry(result):
-                    continue
-                    
-                doc: DiscoveredDocument = self._entry_to_document(result)
-                discovered.append(doc)
-                total_fetched += 1
-            
-            start += len(results)
-            
-            if start >= total_results:
-                break
+        Pages are pipelined: once a page is parsed and another one is needed,
+        it is handed to a background thread, which waits out the rate limit,
+        downloads and parses it while the caller consumes the current page.
+        Requests are still issued one at a time, at most one per delay_seconds.
+        
+        A paper listed more than once (results shift between pages when new
+        submissions arrive mid-search) is only yielded the first time. All
+        documents of a search share the discovery timestamp of its start.
+        
+        Args:
+            query: arXiv API query string
             
-            # Rate limiting is now handled in _fetch_page() before each request
+        Yields:
+            Discovered documents
+        """
+        start: int = 0
+        # Documents still to yield; negative means no limit, so it never reaches 0
+        remaining: int = self.max_results or -1
         
-        return discovered
+        # Only touched by the prefetch thread, which fetches one page at a time
+        seen_ids: Set[str] = set()
+        self._discovery_timestamp = datetime.now(timezone.utc)
+        
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+        try:
+            pending: Optional[Future] = executor.submit(self._fetch_page, query, start, seen_ids)
+            while pending is not None:
+                documents, entry_count, total_results = pending.result()
+                pending = None
+                
+                if not entry_count:
+                    break
+                
+                start += entry_count
+                
+                # Request the next page before handing this one to the caller
+                if start < total_results and (remaining < 0 or len(documents) < remaining):
+                    pending = executor.submit(self._fetch_page, query, start, seen_ids)
+                
+                for doc in documents:
+                    yield doc
+                    remaining -= 1
+                    if remaining == 0:
+                        return
+        finally:
+            # Don't wait for a prefetch the caller no longer needs
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._discovery_timestamp = None
     
-    def _fetch_page(self, query: str, start: int) -> Tuple[List[ET.Element], int]:
+    def _fetch_page(
+        self,
+        query: str,
+        start: int,
+        seen_ids: Optional[Set[str]] = None
+    ) -> Tuple[List[DiscoveredDocument], int, int]:
         """
-        Fetch a single page of results from ArXiv API.
+        Fetch and parse a single page of results from ArXiv API.
+        
+        Run on the prefetch thread, so the caller's thread never parses XML.
         
         Args:
             query: Search query
             start: Starting index
+            seen_ids: arXiv IDs already discovered; see _parse_page
             
         Returns:
-            Tuple of (list of entry elements, total_results)
+            Tuple of (documents, number of entries on the page, total_results)
         """
-        import logging
-        logger = logging.getLogger(__name__)
+        response: Optional[requests.Response] = self._request_page(query, start)
+        if response is None:
+            return [], 0, 0
+        try:
+            return self._parse_page(response.iter_content(chunk_size=STREAM_CHUNK_SIZE), seen_ids)
+        finally:
+            response.close()
+    
+    def _request_page(self, query: str, start: int) -> Optional[requests.Response]:
+        """
+        Request a single page of results from ArXiv API, honouring the rate limit.
+        
+        Only the headers are read; the body is left to be streamed by the caller.
+        A throttled or overloaded response (429/5xx) doubles delay_seconds and is
+        retried up to max_retries times, after the server's Retry-After if given.
         
+        Args:
+            query: Search query
+            start: Starting index
+            
+        Returns:
+            Streaming response (the caller must close it), or None if the request failed
+        """
         params: Dict[str, Any] = {
             "search_query": query,
             "start": start,
@@ -102,41 +216,130 @@ class ArxivDiscovery:
             "sortOrder": "descending"
         }
         
-        logger.info(f"Requesting page (start: {start}, max: {self.page_size}): {self.api_url}")
-        
-        # Enforce rate limiting before making request
-        current_time: float = time.time()
-        time_since_last_request: float = current_time - self.last_request_time
+        # %-style arguments are only formatted when INFO is enabled (verbose runs)
+        self.logger.info("Requesting page (start: %d, max: %d): %s", start, self.page_size, self.api_url)
         
-        if self.last_request_time > 0 and time_since_last_request < self.delay_seconds:
-            sleep_time: float = self.delay_seconds - time_since_last_request
-            logger.info(f"Rate limiting: waiting {sleep_time:.1f}s before request...")
-            time.sleep(sleep_time)
-        
-        try:
-            # Update timestamp before making request
-            self.last_request_time = time.time()
-            response: requests.Response = self.session.get(self.api_url, params=params, timeout=30)
-            response.raise_for_status()
+        for attempt in range(self.max_retries + 1):
+            # Enforce rate limiting before making request
+            current_time: float = time.time()
+            time_since_last_request: float = current_time - self.last_request_time
             
-            root: ET.Element = ET.fromstring(response.content)
+            if self.last_request_time > 0 and time_since_last_request < self.delay_seconds:
+                sleep_time: float = self.delay_seconds - time_since_last_request
+                self.logger.info("Rate limiting: waiting %.1fs before request...", sleep_time)
+                time.sleep(sleep_time)
             
-            ns = {"atom": "http://www.w3.org/2005/Atom", 
-                  "opensearch": "http://a9.com/-/spec/opensearch/1.1/"}
+            try:
+                # Update timestamp before making request
+                self.last_request_time = time.time()
+                response: requests.Response = self.session.get(
+                    self.api_url, params=params, timeout=30, stream=True
+                )
+                if response.status_code in THROTTLE_STATUS_CODES and attempt < self.max_retries:
+                    retry_after: Optional[float] = self._retry_after_seconds(response)
+                    response.close()
+                    self.delay_seconds = min(self.max_delay_seconds, self.delay_seconds * 2)
+                    wait_time: float = max(retry_after or 0.0, self.delay_seconds)
+                    self.logger.warning(
+                        "ArXiv API returned %d, retrying in %.1fs (retry %d/%d)",
+                        response.status_code, wait_time, attempt + 1, self.max_retries
+                    )
+                    time.sleep(wait_time)
+                    continue
+                try:
+                    response.raise_for_status()
+                except Exception:
+                    response.close()
+                    raise
+                self.delay_seconds = max(self.min_delay_seconds, self.delay_seconds * 0.95)
+                return response
+                
+            except Exception as e:
+                self.logger.error("Error fetching ArXiv page: %s", e)
+                return None
+        return None
+    
+    @staticmethod
+    def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+        """
+        Read a Retry-After header given in seconds.
+        
+        Args:
+            response: HTTP response
             
-            total_results_elem = root.find("opensearch:totalResults", ns)
-            total_results: int = int(total_results_elem.text) if total_results_elem is not None else 0
+        Returns:
+            Seconds to wait, or None if the header is missing or an HTTP date
+        """
+        value: Optional[str] = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+    
+    def _parse_page(
+        self,
+        chunks: Iterable[bytes],
+        seen_ids: Optional[Set[str]] = None
+    ) -> Tuple[List[DiscoveredDocument], int, int]:
+        """
+        Parse a page of results from ArXiv API.
+        
+        The response is stream-parsed as it downloads: each entry is converted
+        (or skipped if redacted) as soon as it is complete and then cleared, so
+        neither the body nor the page's element tree is ever held in full.
+        
+        Args:
+            chunks: Raw Atom response body, in pieces
+            seen_ids: arXiv IDs already discovered; entries with one of these are
+                skipped, and the IDs of new entries are added
             
-            entries: List[ET.Element] = root.findall("atom:entry", ns)
+        Returns:
+            Tuple of (documents, number of entries on the page, total_results)
+        """
+        try:
+            documents: List[DiscoveredDocument] = []
+            entry_count: int = 0
+            total_results: int = 0
+            for elem in self._iter_completed_elements(chunks):
+                if elem.tag == ATOM_ENTRY_TAG:
+                    entry_count += 1
+                    if not self._is_redacted_entry(elem):
+                        doc: Optional[DiscoveredDocument] = self._entry_to_document(elem, seen_ids)
+                        if doc is not None:
+                            documents.append(doc)
+                    elem.clear()
+                elif elem.tag == OPENSEARCH_TOTAL_RESULTS_TAG and elem.text:
+                    total_results = int(elem.text)
             
-            logger.info(f"Got page: {len(entries)} entries, {total_results} total results")
+            self.logger.info("Got page: %d entries, %d total results", entry_count, total_results)
             
-            return entries, total_results
+            return documents, entry_count, total_results
             
         except Exception as e:
-            import logging
-            logging.error(f"Error fetching ArXiv page: {e}")
-            return [], 0
+            self.logger.error("Error parsing ArXiv page: %s", e)
+            return [], 0, 0
+    
+    @staticmethod
+    def _iter_completed_elements(chunks: Iterable[bytes]) -> Iterator[ET.Element]:
+        """
+        Feed chunks to an incremental XML parser, yielding elements as they close.
+        
+        Args:
+            chunks: XML document, in pieces
+            
+        Yields:
+            Each element once its end tag has been parsed
+        """
+        parser: ET.XMLPullParser = ET.XMLPullParser(events=("end",))
+        for chunk in chunks:
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                yield elem
+        parser.close()
+        for _, elem in parser.read_events():
+            yield elem
     
     def _is_redacted_entry(self, entry: ET.Element) -> bool:
         """
@@ -148,46 +351,64 @@ class ArxivDiscovery:
         Returns:
             True if paper is redacted/withdrawn
         """
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        title_elem = entry.find("atom:title", ns)
+        title_elem = entry.find(ATOM_TITLE_TAG)
         if title_elem is None:
             return True
         
         title_lower: str = title_elem.text.lower() if title_elem.text else ""
-        return any([
-            'withdrawn' in title_lower,
-            'redacted' in title_lower,
-            title_lower.startswith('[redacted]'),
-        ])
+        # Short-circuits; a '[redacted]' prefix is already covered by 'redacted'
+        return 'withdrawn' in title_lower or 'redacted' in title_lower
     
-    def _entry_to_document(self, entry: ET.Element) -> DiscoveredDocument:
+    def _entry_to_document(
+        self,
+        entry: ET.Element,
+        seen_ids: Optional[Set[str]] = None
+    ) -> Optional[DiscoveredDocument]:
         """
         Convert arXiv XML entry to DiscoveredDocument.
         
         Args:
             entry: XML entry element
+            seen_ids: arXiv IDs already discovered; the entry's ID is added if new
             
         Returns:
-            Discovered document model
+            Discovered document model, or None if its arXiv ID was already seen
         """
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
+        # One pass over the entry's children, dispatching on tag, instead of
+        # a namespace-resolving find()/findall() per field
+        title_elem: Optional[ET.Element] = None
+        id_elem: Optional[ET.Element] = None
+        pdf_link_elem: Optional[ET.Element] = None
+        author_elems: List[ET.Element] = []
+        for child in entry:
+            tag: str = child.tag
+            if tag == ATOM_LINK_TAG:
+                if pdf_link_elem is None and child.get("title") == "pdf":
+                    pdf_link_elem = child
+            elif tag == ATOM_AUTHOR_TAG:
+                author_elems.append(child)
+            elif tag == ATOM_TITLE_TAG:
+                if title_elem is None:
+                    title_elem = child
+            elif tag == ATOM_ID_TAG:
+                if id_elem is None:
+                    id_elem = child
         
-        title_elem = entry.find("atom:title", ns)
         title: str = title_elem.text.strip() if title_elem is not None and title_elem.text else "Unknown"
         
-        pdf_link = None
-        for link in entry.findall("atom:link", ns):
-            if link.get("title") == "pdf":
-                pdf_link = link.get("href")
-                break
-        
+        pdf_link: Optional[str] = pdf_link_elem.get("href") if pdf_link_elem is not None else None
         if not pdf_link:
-            id_elem = entry.find("atom:id", ns)
             if id_elem is not None and id_elem.text:
                 pdf_link = id_elem.text.replace("/abs/", "/pdf/") + ".pdf"
         
         arxiv_id, version = CacheManager.extract_arxiv_id_and_version(pdf_link) if pdf_link else (None, None)
         
+        # Checked before building the document: its ID would be the same anyway
+        if arxiv_id is not None and seen_ids is not None:
+            if arxiv_id in seen_ids:
+                return None
+            seen_ids.add(arxiv_id)
+        
         if arxiv_id is None:
             doc_id: uuid.UUID = uuid.uuid4()
         else:
@@ -196,8 +417,8 @@ class ArxivDiscovery:
         authors: Optional[List[str]] = None
         if self.include_authors:
             authors = []
-            for author in entry.findall("atom:author", ns):
-                name_elem = author.find("atom:name", ns)
+            for author in author_elems:
+                name_elem = author.find(ATOM_NAME_TAG)
                 if name_elem is not None and name_elem.text:
                     authors.append(name_elem.text.strip())
         
@@ -209,7 +430,7 @@ class ArxivDiscovery:
             source_url=pdf_link or "",
             title=title,
             authors=authors,
-            discovery_timestamp=datetime.now(timezone.utc),
+            discovery_timestamp=self._discovery_timestamp or datetime.now(timezone.utc),
             estimated_size=estimated_size,
             content_type="application/pdf",
             priority_score=None,
@@ -244,6 +465,5 @@ class ArxivDiscovery:
                 for doc in documents
             ]
         }
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
+        ensure_dir(output_path.parent)
+        atomic_write_bytes(output_path, json_dumps(output_data))
@@ -6,7 +6,6 @@ for converting the cleaned HTML to Markdown format.
 """
 
 import logging
-import json
 import re
 from typing import List, Tuple, Dict, Any, Optional
 from datetime import datetime, timezone
@@ -15,6 +14,25 @@ from pathlib import Path
 from bs4 import BeautifulSoup, NavigableString, Tag
 from markdownify import markdownify as md
 from models import AcquiredDocument, ProcessingMetadata
+from utils import BackgroundWriter, ensure_dir, json_dumps
+
+# Compiled once at import; these run for every math tag, table cell and document
+EQUATION_TABLE_CLASS_PATTERN = re.compile(r"ltx_equationgroup|ltx_eqn_align|ltx_eqn_table")
+LATEX_COMMENT_PATTERN = re.compile(r"(?<!\\)%")
+LATEX_ESCAPED_SCRIPT_PATTERN = re.compile(r"\\([_^])")
+LATEX_ESCAPED_BRACKET_PATTERN = re.compile(r"\\(?=[\[\]])")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+EXCESS_NEWLINES_PATTERN = re.compile(r"\n{3,}")
+
+# ArXiv page chrome removed before conversion
+PAGE_CHROME_CLASSES: Tuple[str, ...] = (
+    "ltx_page_header",
+    "ltx_page_footer",
+    "ltx_navbar",
+    "ar5iv-footer",
+    "extra-services",
+)
+ACKNOWLEDGMENT_HEADINGS: frozenset = frozenset({"acknowledgments", "acknowledgements"})
 
 
 class ArxivHtmlProcessor:
@@ -63,11 +81,9 @@ class ArxivHtmlProcessor:
 
         try:
             html_path: Path = Path(acquired.local_path)
-            if not html_path.exists():
-                raise FileNotFoundError(f"HTML file not found: {html_path}")
-
             self.logger.info(f"Starting HTML conversion for {html_path.name}")
 
+            # open() raises FileNotFoundError itself; no separate exists() check
             with open(html_path, "r", encoding="utf-8") as f:
                 html_content = f.read()
 
@@ -79,13 +95,7 @@ class ArxivHtmlProcessor:
             # --- Cleaning & Pre-processing ---
 
             # Remove ArXiv header/footer and navigation
-            for class_name in [
-                "ltx_page_header",
-                "ltx_page_footer",
-                "ltx_navbar",
-                "ar5iv-footer",
-                "extra-services",
-            ]:
+            for class_name in PAGE_CHROME_CLASSES:
                 for tag in soup.find_all(class_=class_name):
                     tag.decompose()
 
@@ -106,10 +116,7 @@ class ArxivHtmlProcessor:
                 for tag in soup.find_all(class_="ltx_acknowledgments"):
                     tag.decompose()
                 for h in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
-                    if h.get_text().lower().strip() in [
-                        "acknowledgments",
-                        "acknowledgements",
-                    ]:
+                    if h.get_text().lower().strip() in ACKNOWLEDGMENT_HEADINGS:
                         parent = h.find_parent(class_="ltx_section")
                         if parent:
                             parent.decompose()
@@ -133,7 +140,7 @@ class ArxivHtmlProcessor:
             if self.preserve_equations:
                 for table in soup.find_all(
                     "table",
-                    class_=re.compile(r"ltx_equationgroup|ltx_eqn_align|ltx_eqn_table"),
+                    class_=EQUATION_TABLE_CLASS_PATTERN,
                 ):
                     text = table.get_text(" ", strip=True)
                     if text:
@@ -177,11 +184,17 @@ class ArxivHtmlProcessor:
 
                     if latex:
                         # Clean up LaTeX source (borrowed from arxiv2md)
-                        latex = re.sub(r"(?<!\\)%", "", latex)  # Remove comments
-                        latex = re.sub(
-                            r"\\([_^])", r"\1", latex
-                        )  # Unescape underscores/carets
-                        latex = re.sub(r"\\(?=[\[\]])", "", latex)  # Unescape brackets
+                        # Substring checks skip the regex passes for the
+                        # common formulas that contain nothing to clean
+                        if "%" in latex:
+                            latex = LATEX_COMMENT_PATTERN.sub("", latex)  # Remove comments
+                        if "\\" in latex:
+                            latex = LATEX_ESCAPED_SCRIPT_PATTERN.sub(
+                                r"\1", latex
+                            )  # Unescape underscores/carets
+                            latex = LATEX_ESCAPED_BRACKET_PATTERN.sub(
+                                "", latex
+                            )  # Unescape brackets
 
                         is_block = math_tag.get("display") == "block"
 
@@ -210,11 +223,14 @@ class ArxivHtmlProcessor:
             markdown = self._clean_markdown(markdown)
 
             doc_dir: Path = output_dir / f"arxiv_{acquired.document_id}"
+            # Not ensure_dir(): a staging directory is moved away once saved,
+            # so the same path may need creating again
             doc_dir.mkdir(parents=True, exist_ok=True)
             md_path: Path = doc_dir / "full_document.md"
 
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write(markdown)
+            # Encode once and write the bytes directly, without a text-mode
+            # file object re-encoding through its own buffer
+            md_path.write_bytes(markdown.encode("utf-8"))
 
             duration: float = (datetime.now(timezone.utc) - start_time).total_seconds()
 
@@ -318,35 +334,44 @@ class ArxivHtmlProcessor:
 
     def _clean_text(self, text: str) -> str:
         """normalize whitespace"""
-        return re.sub(r"\s+", " ", text).strip()
+        return WHITESPACE_PATTERN.sub(" ", text).strip()
 
     def _clean_markdown(self, markdown: str) -> str:
         """
         Clean markdown output.
         """
         # Remove excessive newlines
-        markdown = re.sub(r"\n{3,}", "\n\n", markdown)
+        markdown = EXCESS_NEWLINES_PATTERN.sub("\n\n", markdown)
 
         lines = markdown.split("\n")
         cleaned_lines = []
         for line in lines:
-            if line.strip():
-                cleaned_lines.append(line.rstrip())
+            # rstrip() is empty exactly when the line is blank, so strip once
+            line = line.rstrip()
+            if line:
+                cleaned_lines.append(line)
             elif cleaned_lines and cleaned_lines[-1] != "":
                 cleaned_lines.append("")
 
         return "\n".join(cleaned_lines)
 
+    @staticmethod
     def save_processing_metadata(
-        self, metadata: ProcessingMetadata, output_path: Path
+        metadata: ProcessingMetadata,
+        output_path: Path,
+        writer: Optional[BackgroundWriter] = None,
+        indent: bool = True,
     ) -> None:
-        """Save processing metadata to JSON file."""
+        """Save processing metadata to JSON file, through writer if given."""
         data: Dict[str, Any] = {
             "processor_used": metadata.processor_used,
             "processing_timestamp": metadata.processing_timestamp.isoformat(),
             "processing_duration": metadata.processing_duration,
             "conversion_warnings": metadata.conversion_warnings,
         }
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        ensure_dir(output_path.parent)
+        data_bytes: bytes = json_dumps(data, indent)
+        if writer is not None:
+            writer.write(output_path, data_bytes)
+        else:
+            output_path.write_bytes(data_bytes)
@@ -5,10 +5,21 @@ Coordinates discovery, HTML acquisition, processing, and chunking stages
 to produce HEPilot-compliant output for RAG system ingestion.
 """
 
+import multiprocessing
+import os
+import shutil
 import sys
 import argparse
+from collections import deque
+from functools import cached_property
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Deque
 from uuid import UUID
 from datetime import datetime, timezone
 
@@ -16,10 +27,16 @@ from config import ConfigManager
 from discovery import ArxivDiscovery
 from acquisition import ArxivHtmlAcquisition
 from fast_html_processing import ArxivHtmlProcessor
-from chunking import ArxivChunker
+from chunking import ArxivChunker, check_chunk_size
 from metadata import MetadataManager
 from cache_manager import CacheManager, CacheEntry
-from models import DiscoveredDocument, AcquiredDocument, ChunkContent, DocumentMetadata
+from models import (
+    DiscoveredDocument,
+    AcquiredDocument,
+    ChunkContent,
+    DocumentMetadata,
+    ProcessingMetadata,
+)
 from utils import (
     Colors,
     print_header,
@@ -28,9 +45,123 @@ from utils import (
     print_status,
     validate_html_exists,
     get_html_path,
+    BackgroundWriter,
+    restore_replaced_dirs,
+    has_saved_chunks,
+    count_saved_chunks,
+    json_loads,
 )
 
 
+def _create_processor(config_manager: ConfigManager) -> ArxivHtmlProcessor:
+    """Build the HTML processor from adapter configuration."""
+    return ArxivHtmlProcessor(
+        preserve_equations=config_manager.get_preserve_equations(),
+        exclude_references=config_manager.get_exclude_references(),
+        exclude_acknowledgments=config_manager.get_exclude_acknowledgments(),
+        exclude_author_lists=config_manager.get_exclude_author_lists(),
+        processing_timeout=config_manager.get_processing_timeout(),
+    )
+
+
+def _create_chunker(config_manager: ConfigManager) -> ArxivChunker:
+    """Build the chunker from adapter configuration."""
+    return ArxivChunker(
+        chunk_size=config_manager.get_chunk_size(),
+        chunk_overlap=config_manager.get_chunk_overlap(),
+        model_name=config_manager.get_embedding_model_name(),
+        use_model_tokenizer=config_manager.get_use_model_tokenizer(),
+        cache_dir=config_manager.get_model_cache_dir(),
+        token_count_workers=config_manager.get_token_count_workers(),
+        strategy=config_manager.get_chunking_strategy(),
+    )
+
+
+def _convert_and_chunk(
+    processor: ArxivHtmlProcessor,
+    chunker: ArxivChunker,
+    acquired: AcquiredDocument,
+    documents_dir: Path,
+) -> Tuple[Path, ProcessingMetadata, Optional[List[ChunkContent]]]:
+    """
+    Convert one HTML document to markdown and chunk it.
+
+    Args:
+        processor: HTML processor
+        chunker: Chunker
+        acquired: Acquired document to convert
+        documents_dir: Directory for per-document outputs
+
+    Returns:
+        Tuple of (markdown_path, processing_metadata, chunks); chunks is None
+        when conversion failed
+    """
+    markdown_path, proc_metadata = processor.process(acquired, documents_dir)
+    if not markdown_path.is_file():
+        return markdown_path, proc_metadata, None
+    chunks: List[ChunkContent] = chunker.chunk(markdown_path, acquired.document_id)
+    return markdown_path, proc_metadata, chunks
+
+
+def _list_dir_names(directory: Path) -> frozenset:
+    """
+    List the entry names of a directory in a single scandir call.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Entry names, empty if the directory does not exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        return frozenset()
+
+
+# Per-process state for pool workers, built once by _init_process_worker
+_worker_processor: Optional[ArxivHtmlProcessor] = None
+_worker_chunker: Optional[ArxivChunker] = None
+
+
+def _init_process_worker(config_path: str) -> None:
+    """Load the processor and chunker (and its tokenizer) once per worker process."""
+    global _worker_processor, _worker_chunker
+    config_manager: ConfigManager = ConfigManager(Path(config_path))
+    _worker_processor = _create_processor(config_manager)
+    _worker_chunker = _create_chunker(config_manager)
+
+
+def _process_one(
+    acquired_data: Dict[str, Any], documents_dir: str
+) -> Tuple[str, Dict[str, Any], Optional[List[ChunkContent]]]:
+    """
+    Convert and chunk one document inside a pool worker.
+
+    Args:
+        acquired_data: AcquiredDocument fields from model_dump()
+        documents_dir: Directory for per-document outputs
+
+    Returns:
+        Tuple of (markdown_path, processing metadata fields, chunks)
+    """
+    markdown_path, proc_metadata, chunks = _convert_and_chunk(
+        _worker_processor,
+        _worker_chunker,
+        AcquiredDocument(**acquired_data),
+        Path(documents_dir),
+    )
+    return str(markdown_path), proc_metadata.model_dump(), chunks
+
+
+# Pending cache status updates are written out after this many documents
+STATUS_FLUSH_INTERVAL: int = 100
+# Under documents/: per-document outputs are assembled here, then moved into
+# place; removed at startup along with other *.tmp leftovers
+STAGING_DIR_NAME: str = "staging.tmp"
+
+
 class ArxivHtmlAdapterPipeline:
     """Orchestrates the complete ArXiv HTML adapter pipeline."""
 
@@ -52,43 +183,86 @@ class ArxivHtmlAdapterPipeline:
             enable_cache: Whether to enable caching system
             verbose: Enable verbose debug output (auto-enabled in dev mode)
         """
+        self.config_path: Path = config_path
         self.config_manager: ConfigManager = ConfigManager(config_path)
+        # The chunker is only built lazily (or in pool workers), so reject a
+        # chunk_size the model cannot take now, before anything is downloaded
+        if self.config_manager.get_use_model_tokenizer():
+            check_chunk_size(
+                self.config_manager.get_chunk_size(),
+                self.config_manager.get_embedding_model_name(),
+                self.config_manager.get_model_cache_dir(),
+            )
         self.output_dir: Path = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.max_results: Optional[int] = max_results
         self.enable_cache: bool = enable_cache
         self.verbose: bool = verbose
         self.cache_manager: Optional[CacheManager] = None
+        # (arxiv_id, processing_status, chunk_count) awaiting a batched cache write
+        self._status_updates: List[Tuple[str, str, Optional[int]]] = []
+        # (landed, discovered, catalog_entry, catalog_entries) for documents whose
+        # outputs are queued on the writer; recorded once they are in place
+        self._pending_outputs: Deque[
+            Tuple[Future, DiscoveredDocument, Dict[str, Any], List[Dict[str, Any]]]
+        ] = deque()
         if enable_cache:
-            self.cache_manager = CacheManager(output_dir / "cache")
+            self.cache_manager = CacheManager(
+                output_dir / "cache",
+                processing_config_hash=self.config_manager.get_processing_config_hash(),
+            )
+        include_authors: bool = self.config_manager.get_include_authors_metadata()
         self.metadata_manager: MetadataManager = MetadataManager(
             adapter_version=self.config_manager.config.version,
-            include_authors=self.config_manager.get_include_authors_metadata(),
+            include_authors=include_authors,
+            log_level=self.config_manager.get_log_level(),
         )
         self.discovery: ArxivDiscovery = ArxivDiscovery(
             max_results=max_results,
-            include_authors=self.config_manager.get_include_authors_metadata(),
+            include_authors=include_authors,
         )
         self.acquisition: ArxivHtmlAcquisition = ArxivHtmlAcquisition(
             download_dir=output_dir / "downloads", verbose=self.verbose
         )
-        self.processor: ArxivHtmlProcessor = ArxivHtmlProcessor(
-            preserve_equations=self.config_manager.get_preserve_equations(),
-            exclude_references=self.config_manager.get_exclude_references(),
-            exclude_acknowledgments=self.config_manager.get_exclude_acknowledgments(),
-            exclude_author_lists=self.config_manager.get_exclude_author_lists(),
-            processing_timeout=self.config_manager.get_processing_timeout(),
-        )
-        self.chunker: ArxivChunker = ArxivChunker(
-            chunk_size=self.config_manager.get_chunk_size(),
-            chunk_overlap=self.config_manager.get_chunk_overlap(),
-            model_name=self.config_manager.get_embedding_model_name(),
-            use_model_tokenizer=self.config_manager.get_use_model_tokenizer(),
-            cache_dir=self.config_manager.get_model_cache_dir(),
-        )
+        self.chunks_format: str = self.config_manager.get_chunks_format()
+        self.pretty_json: bool = self.config_manager.get_pretty_json()
+        self.writer: BackgroundWriter = BackgroundWriter()
+        self.staging_dir: Path = output_dir / "documents" / STAGING_DIR_NAME
+        # Downloads running on a background thread, which owns the terminal
+        # for its progress bar until done
+        self._background_acquisition: Optional[Future] = None
+        self._remove_partial_outputs()
 
         self._print_configuration()
 
+    @cached_property
+    def processor(self) -> ArxivHtmlProcessor:
+        """HTML processor for in-process conversion, built on first use."""
+        return _create_processor(self.config_manager)
+
+    @cached_property
+    def chunker(self) -> ArxivChunker:
+        """
+        Chunker for in-process chunking, built on first use.
+
+        Loading it loads the embedding model's tokenizer, which discovery,
+        download-only runs and the process pool path never need here.
+        """
+        return _create_chunker(self.config_manager)
+
+    def _remove_partial_outputs(self) -> None:
+        """
+        Clean up document directories left behind by an interrupted run.
+
+        Temp and staging directories are deleted, and an old document directory
+        whose replacement never landed is restored.
+        """
+        documents_dir: Path = self.output_dir / "documents"
+        for name in _list_dir_names(documents_dir):
+            if name.endswith(".tmp"):
+                shutil.rmtree(documents_dir / name, ignore_errors=True)
+        restore_replaced_dirs(documents_dir)
+
     def _print_configuration(self) -> None:
         """Print pipeline configuration in a colorful format."""
         config_display: Dict[str, Any] = {
@@ -106,6 +280,8 @@ class ArxivHtmlAdapterPipeline:
                 "exclude_acknowledgments": self.config_manager.get_exclude_acknowledgments(),
                 "exclude_author_lists": self.config_manager.get_exclude_author_lists(),
                 "processing_timeout": f"{self.config_manager.get_processing_timeout()}s",
+                "chunks_format": self.chunks_format,
+                "max_workers": self.config_manager.get_max_workers() or "auto",
             },
             "Embedding Model": {
                 "model_name": self.config_manager.get_embedding_model_name(),
@@ -133,6 +309,11 @@ class ArxivHtmlAdapterPipeline:
         to_process_from_cache: List[DiscoveredDocument] = []
         fully_cached: List[DiscoveredDocument] = []
 
+        # List the output directories once instead of probing the filesystem
+        # for every paper; only files that exist are then inspected
+        downloaded_names: frozenset = _list_dir_names(self.output_dir / "downloads")
+        document_dir_names: frozenset = _list_dir_names(self.output_dir / "documents")
+
         for doc in discovered:
             if not doc.arxiv_id:
                 to_download.append(doc)
@@ -147,15 +328,16 @@ class ArxivHtmlAdapterPipeline:
 
             # Check if HTML exists on disk
             html_path: Path = get_html_path(self.output_dir, str(doc.document_id))
-            html_exists: bool = validate_html_exists(html_path)
+            html_exists: bool = html_path.name in downloaded_names and (
+                validate_html_exists(html_path)
+            )
 
             # Check if output directory exists with chunks
             output_dir: Path = (
                 self.output_dir / "documents" / f"arxiv_{doc.document_id}"
             )
-            chunks_dir: Path = output_dir / "chunks"
-            has_processed_output: bool = chunks_dir.exists() and any(
-                chunks_dir.glob("chunk_*.md")
+            has_processed_output: bool = output_dir.name in document_dir_names and (
+                has_saved_chunks(output_dir)
             )
 
             # Decision logic
@@ -209,6 +391,24 @@ class ArxivHtmlAdapterPipeline:
                         )
                     to_download.append(doc)
 
+            elif (
+                cached_entry.processing_status == "success"
+                and not self.cache_manager.matches_processing_config(cached_entry)
+            ):
+                # Processed with different settings - reprocess from HTML
+                if html_exists:
+                    if self.verbose:
+                        print(
+                            f"[CACHE] → Reprocess: {doc.arxiv_id} {doc.arxiv_version} (processing config changed)"
+                        )
+                    to_process_from_cache.append(doc)
+                else:
+                    if self.verbose:
+                        print(
+                            f"[CACHE] → Re-download: {doc.arxiv_id} {doc.arxiv_version} (HTML missing)"
+                        )
+                    to_download.append(doc)
+
             elif cached_entry.processing_status == "success":
                 # Fully successful - validate output still exists
                 if has_processed_output:
@@ -258,6 +458,12 @@ class ArxivHtmlAdapterPipeline:
         """
         Run the complete pipeline.
 
+        New papers download in a background thread while papers already on
+        disk are processed. catalog.json therefore does not follow discovery
+        order: it lists fully cached papers first, then papers reprocessed
+        from disk, then new downloads, the last two in the order their
+        processing finishes.
+
         Args:
             query: arXiv search query (default: all:lhcb for LHCb papers across all categories)
             download_only: If True, only download HTMLs without processing
@@ -266,6 +472,9 @@ class ArxivHtmlAdapterPipeline:
         Returns:
             True if pipeline succeeded, False otherwise
         """
+        # Download in the background while papers already on disk are
+        # processed, so the network-bound and CPU-bound stages overlap
+        acquisition_future: Optional[Future] = None
         try:
             import logging
 
@@ -279,7 +488,7 @@ class ArxivHtmlAdapterPipeline:
                 "INFO",
                 "pipeline",
                 "Starting ArXiv HTML adapter pipeline",
-                {
+                context={
                     "query": query,
                     "max_results": self.max_results,
                     "cache_enabled": self.enable_cache,
@@ -292,7 +501,8 @@ class ArxivHtmlAdapterPipeline:
                 self.metadata_manager.log(
                     "INFO",
                     "cache",
-                    f"Cache initialized with {cache_stats['total_papers']} existing entries",
+                    "Cache initialized with %d existing entries",
+                    cache_stats["total_papers"],
                 )
                 if self.verbose:
                     print(
@@ -335,103 +545,14 @@ class ArxivHtmlAdapterPipeline:
             if to_download:
                 if not self.verbose:
                     print(f"\nAcquiring {len(to_download)} papers...\n")
-                acquired: List[AcquiredDocument] = self._run_acquisition(to_download)
-                if acquired:
-                    if self.enable_cache and self.cache_manager:
-                        for disc, acq in zip(to_download, acquired):
-                            if acq.download_status == "success" and disc.arxiv_id:
-                                cached_entry = self.cache_manager.get_cached_entry(
-                                    disc.arxiv_id
-                                )
-                                doc_dir: Path = (
-                                    self.output_dir
-                                    / "documents"
-                                    / f"arxiv_{acq.document_id}"
-                                )
-
-                                if not cached_entry or cached_entry.version != (
-                                    disc.arxiv_version or "v1"
-                                ):
-                                    # New paper or new version - create fresh cache entry
-                                    self.cache_manager.add_entry(
-                                        arxiv_id=disc.arxiv_id,
-                                        version=disc.arxiv_version or "v1",
-                                        document_id=acq.document_id,
-                                        file_hash_sha256=acq.file_hash_sha256,
-                                        output_dir=doc_dir,
-                                        source_url=disc.source_url,  # Note: this might be the HTML url now?
-                                        title=disc.title,
-                                        download_status="success",
-                                        processing_status="pending",
-                                    )
-                                    if self.verbose:
-                                        print(
-                                            f"[CACHE] ✓ Downloaded: {disc.arxiv_id} {disc.arxiv_version}"
-                                        )
-                                elif cached_entry.download_status != "success":
-                                    # Existing paper but download status needs update
-                                    self.cache_manager.add_entry(
-                                        arxiv_id=disc.arxiv_id,
-                                        version=disc.arxiv_version or "v1",
-                                        document_id=acq.document_id,
-                                        file_hash_sha256=acq.file_hash_sha256,
-                                        output_dir=doc_dir,
-                                        source_url=disc.source_url,
-                                        title=disc.title,
-                                        download_status="success",
-                                        processing_status=cached_entry.processing_status,  # Preserve existing status
-                                    )
-                                    if self.verbose:
-                                        print(
-                                            f"[CACHE] ✓ Updated download status: {disc.arxiv_id} {disc.arxiv_version}"
-                                        )
-
-                    # Skip processing in download-only mode
-                    if download_only:
-                        print(
-                            f"\n{Colors.GREEN}✓ Downloaded {len(acquired)} papers (processing skipped){Colors.RESET}\n"
-                        )
-                        self.metadata_manager.log(
-                            "INFO", "pipeline", "Download-only mode: processing skipped"
-                        )
-                    else:
-                        print(f"\nProcessing {len(acquired)} papers...\n")
-                        try:
-                            from tqdm import tqdm
-
-                            papers_iter = tqdm(
-                                zip(to_download, acquired),
-                                total=len(acquired),
-                                desc="Processing",
-                                disable=self.verbose,
-                            )
-                        except ImportError:
-                            papers_iter = zip(to_download, acquired)
-                        for disc, acq in papers_iter:
-                            if acq.download_status != "success":
-                                continue
-                            if self.enable_cache and self.cache_manager:
-                                success: bool = self._process_document_with_cache(
-                                    disc, acq, catalog_entries
-                                )
-                            else:
-                                success: bool = self._process_document(
-                                    disc, acq, catalog_entries
-                                )
-                            if not success:
-                                self.metadata_manager.log(
-                                    "WARNING",
-                                    "pipeline",
-                                    f"Failed to process document: {disc.title}",
-                                )
-                                if (
-                                    self.enable_cache
-                                    and self.cache_manager
-                                    and disc.arxiv_id
-                                ):
-                                    self.cache_manager.update_processing_status(
-                                        disc.arxiv_id, "failed"
-                                    )
+                acquisition_pool: ThreadPoolExecutor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="acquisition"
+                )
+                acquisition_future = acquisition_pool.submit(
+                    self._run_acquisition, to_download
+                )
+                acquisition_pool.shutdown(wait=False)
+                self._background_acquisition = acquisition_future
 
             # Skip retry processing in download-only mode
             if (
@@ -443,15 +564,8 @@ class ArxivHtmlAdapterPipeline:
                 print(
                     f"\n{Colors.CYAN}Processing {len(to_process_from_cache)} papers from cache...{Colors.RESET}\n"
                 )
-                try:
-                    from tqdm import tqdm
-
-                    retry_iter = tqdm(
-                        to_process_from_cache, desc="Processing", disable=self.verbose
-                    )
-                except ImportError:
-                    retry_iter = to_process_from_cache
-                for doc in retry_iter:
+                retry_pairs: List[Tuple[DiscoveredDocument, AcquiredDocument]] = []
+                for doc in to_process_from_cache:
                     cached_entry = self.cache_manager.get_cached_entry(doc.arxiv_id)
                     if not cached_entry:
                         if self.verbose:
@@ -483,7 +597,7 @@ class ArxivHtmlAdapterPipeline:
                         local_path=str(html_path),
                         file_hash_sha256=cached_entry.file_hash_sha256,
                         file_hash_sha512="",
-                        file_size=html_path.stat().st_size if html_path.exists() else 0,
+                        file_size=html_path.stat().st_size,
                         download_timestamp=datetime.now(timezone.utc),
                         download_status="success",
                         retry_count=0,
@@ -495,28 +609,108 @@ class ArxivHtmlAdapterPipeline:
                         print(
                             f"[CACHE] ⟳ Retry processing: {doc.arxiv_id} {doc.arxiv_version}"
                         )
-                    success: bool = self._process_document_with_cache(
-                        doc, acq, catalog_entries
-                    )
-                    if not success:
+                    retry_pairs.append((doc, acq))
+                self._process_documents(retry_pairs, catalog_entries)
+
+            if acquisition_future is not None:
+                acquired: List[AcquiredDocument] = acquisition_future.result()
+                if acquired:
+                    if self.enable_cache and self.cache_manager:
+                        with self.cache_manager.batch():
+                            for disc, acq in zip(to_download, acquired):
+                                if acq.download_status == "success" and disc.arxiv_id:
+                                    cached_entry = self.cache_manager.get_cached_entry(
+                                        disc.arxiv_id
+                                    )
+                                    doc_dir: Path = (
+                                        self.output_dir
+                                        / "documents"
+                                        / f"arxiv_{acq.document_id}"
+                                    )
+
+                                    if not cached_entry or cached_entry.version != (
+                                        disc.arxiv_version or "v1"
+                                    ):
+                                        # New paper or new version - create fresh cache entry
+                                        self.cache_manager.add_entry(
+                                            arxiv_id=disc.arxiv_id,
+                                            version=disc.arxiv_version or "v1",
+                                            document_id=acq.document_id,
+                                            file_hash_sha256=acq.file_hash_sha256,
+                                            output_dir=doc_dir,
+                                            source_url=disc.source_url,  # Note: this might be the HTML url now?
+                                            title=disc.title,
+                                            download_status="success",
+                                            processing_status="pending",
+                                        )
+                                        if self.verbose:
+                                            print(
+                                                f"[CACHE] ✓ Downloaded: {disc.arxiv_id} {disc.arxiv_version}"
+                                            )
+                                    elif cached_entry.download_status != "success":
+                                        # Existing paper but download status needs update
+                                        self.cache_manager.add_entry(
+                                            arxiv_id=disc.arxiv_id,
+                                            version=disc.arxiv_version or "v1",
+                                            document_id=acq.document_id,
+                                            file_hash_sha256=acq.file_hash_sha256,
+                                            output_dir=doc_dir,
+                                            source_url=disc.source_url,
+                                            title=disc.title,
+                                            download_status="success",
+                                            processing_status=cached_entry.processing_status,  # Preserve existing status
+                                        )
+                                        if self.verbose:
+                                            print(
+                                                f"[CACHE] ✓ Updated download status: {disc.arxiv_id} {disc.arxiv_version}"
+                                            )
+
+                    # Skip processing in download-only mode
+                    if download_only:
+                        print(
+                            f"\n{Colors.GREEN}✓ Downloaded {len(acquired)} papers (processing skipped){Colors.RESET}\n"
+                        )
                         self.metadata_manager.log(
-                            "WARNING",
-                            "pipeline",
-                            f"Retry failed for document: {doc.title}",
+                            "INFO", "pipeline", "Download-only mode: processing skipped"
                         )
+                    else:
+                        print(f"\nProcessing {len(acquired)} papers...\n")
+                        self._process_documents(
+                            [
+                                (disc, acq)
+                                for disc, acq in zip(to_download, acquired)
+                                if acq.download_status == "success"
+                            ],
+                            catalog_entries,
+                        )
+
             self._save_catalog(catalog_entries)
             self._save_log()
             self.metadata_manager.log(
                 "INFO",
                 "pipeline",
                 "Pipeline completed successfully",
-                {"documents_processed": len(catalog_entries)},
+                context={"documents_processed": len(catalog_entries)},
             )
             return True
         except Exception as e:
-            self.metadata_manager.log("ERROR", "pipeline", f"Pipeline failed: {str(e)}")
+            self.metadata_manager.log("ERROR", "pipeline", "Pipeline failed: %s", e)
             self._save_log()
             return False
+        finally:
+            if acquisition_future is not None and not acquisition_future.done():
+                # Processing failed while downloads were still running; stop
+                # them before their session is closed
+                self.acquisition.stop()
+                try:
+                    acquisition_future.result()
+                except Exception:
+                    pass
+            self._background_acquisition = None
+            self.discovery.close()
+            self.acquisition.close()
+            if self.cache_manager:
+                self.cache_manager.close()
 
     def _run_process_only_mode(self) -> bool:
         """
@@ -543,8 +737,17 @@ class ArxivHtmlAdapterPipeline:
                 return False
 
             catalog_entries: List[Dict[str, Any]] = []
+            pending_pairs: List[Tuple[DiscoveredDocument, AcquiredDocument]] = []
             unprocessed_count = 0
 
+            # Index cache entries by document_id once instead of scanning per HTML
+            cache_by_document_id: Dict[str, Tuple[str, Any]] = {}
+            if self.enable_cache and self.cache_manager:
+                cache_by_document_id = {
+                    cached_entry.document_id: (cached_arxiv_id, cached_entry)
+                    for cached_arxiv_id, cached_entry in self.cache_manager.cache.items()
+                }
+
             # Check each HTML to see if it needs processing
             for html_path in html_files:
                 # Extract document_id from filename (format: <uuid>.html)
@@ -561,8 +764,7 @@ class ArxivHtmlAdapterPipeline:
 
                 # Check if already processed (has chunks directory with content)
                 output_dir = self.output_dir / "documents" / f"arxiv_{document_id}"
-                chunks_dir = output_dir / "chunks"
-                has_chunks = chunks_dir.exists() and any(chunks_dir.glob("chunk_*.md"))
+                has_chunks = has_saved_chunks(output_dir)
 
                 if has_chunks:
                     # Already processed, load into catalog
@@ -570,11 +772,11 @@ class ArxivHtmlAdapterPipeline:
                         print(f"[SKIP] Already processed: {filename}")
                     # Load existing catalog entry if available
                     doc_metadata_path = output_dir / "document_metadata.json"
-                    if doc_metadata_path.exists():
-                        import json
-
-                        with open(doc_metadata_path, "r", encoding="utf-8") as f:
-                            doc_metadata = json.load(f)
+                    try:
+                        doc_metadata = json_loads(doc_metadata_path.read_bytes())
+                    except FileNotFoundError:
+                        doc_metadata = None
+                    if doc_metadata is not None:
                         catalog_entries.append(
                             {
                                 "document_id": str(document_id),
@@ -595,19 +797,12 @@ class ArxivHtmlAdapterPipeline:
                 source_url = None
                 title = f"Document {str(document_id)[:8]}"
 
-                if self.enable_cache and self.cache_manager:
-                    # Try to find this document in cache by document_id
-                    # cache_stats = self.cache_manager.get_cache_stats() # unused
-                    for (
-                        cached_arxiv_id,
-                        cached_entry,
-                    ) in self.cache_manager.cache.items():
-                        if cached_entry.document_id == str(document_id):
-                            arxiv_id = cached_arxiv_id
-                            arxiv_version = cached_entry.version
-                            source_url = cached_entry.source_url
-                            title = cached_entry.title
-                            break
+                cached = cache_by_document_id.get(str(document_id))
+                if cached is not None:
+                    arxiv_id, cached_entry = cached
+                    arxiv_version = cached_entry.version
+                    source_url = cached_entry.source_url
+                    title = cached_entry.title
 
                 # Create minimal DiscoveredDocument for processing
                 discovered_doc = DiscoveredDocument(
@@ -635,21 +830,10 @@ class ArxivHtmlAdapterPipeline:
                     arxiv_version=arxiv_version,
                 )
 
-                # Process the document
                 print(f"{Colors.CYAN}Processing:{Colors.RESET} {title}")
-                if self.enable_cache and self.cache_manager and arxiv_id:
-                    success = self._process_document_with_cache(
-                        discovered_doc, acquired_doc, catalog_entries
-                    )
-                else:
-                    success = self._process_document(
-                        discovered_doc, acquired_doc, catalog_entries
-                    )
+                pending_pairs.append((discovered_doc, acquired_doc))
 
-                if not success:
-                    self.metadata_manager.log(
-                        "WARNING", "processing", f"Failed to process: {title}"
-                    )
+            self._process_documents(pending_pairs, catalog_entries)
 
             # Save outputs
             self._save_catalog(catalog_entries)
@@ -666,7 +850,7 @@ class ArxivHtmlAdapterPipeline:
                 "INFO",
                 "pipeline",
                 "Process-only mode completed",
-                {
+                context={
                     "processed": unprocessed_count,
                     "skipped": len(html_files) - unprocessed_count,
                     "total_catalog_entries": len(catalog_entries),
@@ -677,7 +861,7 @@ class ArxivHtmlAdapterPipeline:
 
         except Exception as e:
             self.metadata_manager.log(
-                "ERROR", "pipeline", f"Process-only mode failed: {str(e)}"
+                "ERROR", "pipeline", "Process-only mode failed: %s", e
             )
             self._save_log()
             return False
@@ -693,11 +877,11 @@ class ArxivHtmlAdapterPipeline:
             List of discovered documents
         """
         self.metadata_manager.log(
-            "INFO", "discovery", "Starting discovery phase", {"query": query}
+            "INFO", "discovery", "Starting discovery phase", context={"query": query}
         )
         discovered: List[DiscoveredDocument] = self.discovery.search(query)
         self.metadata_manager.log(
-            "INFO", "discovery", f"Discovered {len(discovered)} documents"
+            "INFO", "discovery", "Discovered %d documents", len(discovered)
         )
         self.discovery.save_discovery_output(
             discovered, self.output_dir / "discovery_output.json"
@@ -717,68 +901,276 @@ class ArxivHtmlAdapterPipeline:
             List of acquisition results
         """
         self.metadata_manager.log(
-            "INFO", "acquisition", f"Starting acquisition of {len(documents)} documents"
+            "INFO",
+            "acquisition",
+            "Starting acquisition of %d documents",
+            len(documents),
         )
         acquired: List[AcquiredDocument] = self.acquisition.acquire(documents)
         successful: int = sum(1 for a in acquired if a.download_status == "success")
         self.metadata_manager.log(
             "INFO",
             "acquisition",
-            f"Acquisition complete: {successful}/{len(acquired)} successful",
+            "Acquisition complete: %d/%d successful",
+            successful,
+            len(acquired),
         )
         self.acquisition.save_acquisition_output(
             acquired, self.output_dir / "acquisition_output.json"
         )
         return acquired
 
-    def _process_document_with_cache(
+    def _process_documents(
+        self,
+        pairs: List[Tuple[DiscoveredDocument, AcquiredDocument]],
+        catalog_entries: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Process acquired documents, converting and chunking them in worker processes.
+
+        Cache checks, output writes, cache updates and catalog entries are
+        handled in this process as results come back.
+
+        Args:
+            pairs: (discovered, acquired) document pairs to process
+            catalog_entries: Catalog entries to append to
+        """
+        should_process: Dict[str, bool] = {}
+        if self.enable_cache and self.cache_manager:
+            should_process = self.cache_manager.should_process_many(
+                [
+                    (disc.arxiv_id, disc.arxiv_version or "v1", acq.file_hash_sha256)
+                    for disc, acq in pairs
+                    if disc.arxiv_id
+                ]
+            )
+        pending: List[Tuple[DiscoveredDocument, AcquiredDocument]] = []
+        for discovered, acquired in pairs:
+            cache_valid: bool = not should_process.get(discovered.arxiv_id, True)
+            if cache_valid and self._load_if_cached(discovered, catalog_entries):
+                continue
+            if (
+                self.verbose
+                and self.enable_cache
+                and self.cache_manager
+                and discovered.arxiv_id
+            ):
+                print(
+                    f"[CACHE] ⟳ Processing: {discovered.arxiv_id} {discovered.arxiv_version} - {discovered.title[:60]}..."
+                )
+            pending.append((discovered, acquired))
+        if not pending:
+            return
+        try:
+            self._run_processing(pending, catalog_entries)
+        finally:
+            self._flush_status_updates()
+
+    def _run_processing(
+        self,
+        pending: List[Tuple[DiscoveredDocument, AcquiredDocument]],
+        catalog_entries: List[Dict[str, Any]],
+    ) -> None:
+        """Convert, chunk and save documents that need processing."""
+        max_workers: int = min(
+            self.config_manager.get_max_workers() or os.cpu_count() or 1, len(pending)
+        )
+        if max_workers <= 1:
+            for discovered, acquired in self._progress(pending):
+                if not self._process_document(discovered, acquired, catalog_entries):
+                    self._record_processing_result(discovered, False)
+                self._collect_landed_outputs()
+            return
+
+        documents_dir: str = str(self.staging_dir)
+        # Spawn workers rather than fork them: this process runs the writer and
+        # download threads and holds a sqlite connection, which must not cross
+        # a fork. _init_process_worker rebuilds everything from config_path.
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_process_worker,
+            initargs=(str(self.config_path),),
+        ) as pool:
+            futures: Dict[Future, Tuple[DiscoveredDocument, AcquiredDocument]] = {}
+            for discovered, acquired in pending:
+                self.metadata_manager.log(
+                    "INFO", "processing", "Processing document: %s", discovered.title
+                )
+                future: Future = pool.submit(
+                    _process_one, acquired.model_dump(), documents_dir
+                )
+                futures[future] = (discovered, acquired)
+            # Handle results in completion order so one slow paper does not
+            # hold back writing the outputs of those already finished
+            for future in self._progress(as_completed(futures), total=len(futures)):
+                discovered, acquired = futures[future]
+                try:
+                    markdown_path, proc_data, chunks = future.result()
+                    success = self._save_document_outputs(
+                        discovered,
+                        acquired,
+                        Path(markdown_path),
+                        ProcessingMetadata(**proc_data),
+                        chunks,
+                        catalog_entries,
+                    )
+                except Exception as e:
+                    self.metadata_manager.log(
+                        "ERROR", "processing", "Failed to process document: %s", e
+                    )
+                    # Drop the half-written markdown the worker may have left
+                    self.writer.discard_dir(
+                        self.staging_dir / f"arxiv_{acquired.document_id}"
+                    )
+                    success = False
+                if not success:
+                    self._record_processing_result(discovered, False)
+                self._collect_landed_outputs()
+
+    def _progress(self, items: Any, total: Optional[int] = None) -> Any:
+        """
+        Wrap items in a processing progress bar when tqdm is available.
+
+        No bar is shown while background downloads are drawing theirs.
+        """
+        if self._background_acquisition is not None and (
+            not self._background_acquisition.done()
+        ):
+            return items
+        try:
+            from tqdm import tqdm
+
+            # Refresh at most twice a second; the main thread also collects
+            # worker results
+            return tqdm(
+                items,
+                total=total,
+                desc="Processing",
+                disable=self.verbose,
+                mininterval=0.5,
+            )
+        except ImportError:
+            return items
+
+    def _load_if_cached(
         self,
         discovered: DiscoveredDocument,
-        acquired: AcquiredDocument,
         catalog_entries: List[Dict[str, Any]],
     ) -> bool:
         """
-        Process single document with cache checking.
+        Add a document whose cached outputs are still valid to the catalog.
+
+        Returns:
+            True if the cached outputs were loaded, False if it needs processing
         """
-        if not discovered.arxiv_id or not self.cache_manager:
-            return self._process_document(discovered, acquired, catalog_entries)
-        should_process: bool = self.cache_manager.should_process(
+        self.metadata_manager.log(
+            "INFO",
+            "cache",
+            "Using cached version: %s (%s %s)",
+            discovered.title,
             discovered.arxiv_id,
-            discovered.arxiv_version or "v1",
-            acquired.file_hash_sha256,
+            discovered.arxiv_version,
         )
-        if not should_process:
-            self.metadata_manager.log(
-                "INFO",
-                "cache",
-                f"Using cached version: {discovered.title} ({discovered.arxiv_id} {discovered.arxiv_version})",
-            )
-            if self.verbose:
-                print(
-                    f"[CACHE] ✓ Using cached: {discovered.arxiv_id} {discovered.arxiv_version} - {discovered.title[:60]}..."
-                )
-            cached_entry = self.cache_manager.get_cached_entry(discovered.arxiv_id)
-            if cached_entry:
-                return self._load_from_cache(cached_entry, catalog_entries)
         if self.verbose:
             print(
-                f"[CACHE] ⟳ Processing: {discovered.arxiv_id} {discovered.arxiv_version} - {discovered.title[:60]}..."
+                f"[CACHE] ✓ Using cached: {discovered.arxiv_id} {discovered.arxiv_version} - {discovered.title[:60]}..."
             )
-        success: bool = self._process_document(discovered, acquired, catalog_entries)
-        if success and discovered.arxiv_id:
-            self.cache_manager.update_processing_status(discovered.arxiv_id, "success")
-            self.metadata_manager.log(
-                "INFO",
-                "cache",
-                f"Cached: {discovered.title} ({discovered.arxiv_id} {discovered.arxiv_version})",
+        cached_entry = self.cache_manager.get_cached_entry(discovered.arxiv_id)
+        return bool(
+            cached_entry and self._load_from_cache(cached_entry, catalog_entries)
+        )
+
+    def _collect_landed_outputs(self, wait: bool = False) -> None:
+        """
+        Record documents whose queued outputs have been moved into place.
+
+        A document is only added to the catalog and cached as processed once
+        its directory has landed; if writing it failed, it is recorded as failed.
+
+        Args:
+            wait: Block until every queued document has settled, rather than
+                only collecting those already done
+        """
+        while self._pending_outputs:
+            landed, discovered, catalog_entry, catalog_entries = self._pending_outputs[0]
+            if not wait and not landed.done():
+                break
+            self._pending_outputs.popleft()
+            try:
+                landed.result()
+            except Exception as e:
+                self.metadata_manager.log(
+                    "ERROR",
+                    "processing",
+                    "Failed to write outputs for %s: %s",
+                    discovered.title,
+                    e,
+                )
+                self._record_processing_result(discovered, False)
+                continue
+            catalog_entries.append(catalog_entry)
+            self._record_processing_result(
+                discovered, True, catalog_entry["chunk_count"]
             )
-            if self.verbose:
-                print(
-                    f"[CACHE] ✓ Processed: {discovered.arxiv_id} {discovered.arxiv_version}"
+
+    def _record_processing_result(
+        self,
+        discovered: DiscoveredDocument,
+        success: bool,
+        chunk_count: Optional[int] = None,
+    ) -> None:
+        """Log the outcome of processing a document and update its cache entry."""
+        use_cache: bool = bool(
+            self.enable_cache and self.cache_manager and discovered.arxiv_id
+        )
+        if success:
+            if use_cache:
+                self._queue_status_update(discovered.arxiv_id, "success", chunk_count)
+                self.metadata_manager.log(
+                    "INFO",
+                    "cache",
+                    "Cached: %s (%s %s)",
+                    discovered.title,
+                    discovered.arxiv_id,
+                    discovered.arxiv_version,
                 )
-        elif not success and discovered.arxiv_id:
-            self.cache_manager.update_processing_status(discovered.arxiv_id, "failed")
-        return success
+                if self.verbose:
+                    print(
+                        f"[CACHE] ✓ Processed: {discovered.arxiv_id} {discovered.arxiv_version}"
+                    )
+            return
+        self.metadata_manager.log(
+            "WARNING", "pipeline", "Failed to process document: %s", discovered.title
+        )
+        if use_cache:
+            self._queue_status_update(discovered.arxiv_id, "failed")
+
+    def _queue_status_update(
+        self, arxiv_id: str, processing_status: str, chunk_count: Optional[int] = None
+    ) -> None:
+        """Queue a cache status update, writing the cache every STATUS_FLUSH_INTERVAL documents."""
+        self._status_updates.append((arxiv_id, processing_status, chunk_count))
+        if len(self._status_updates) >= STATUS_FLUSH_INTERVAL:
+            self._save_status_updates()
+
+    def _save_status_updates(self) -> None:
+        """Save queued cache status updates at once."""
+        if self._status_updates and self.cache_manager:
+            self.cache_manager.update_processing_status_many(self._status_updates)
+        self._status_updates = []
+
+    def _flush_status_updates(self) -> None:
+        """
+        Wait for queued output writes, record the documents they belong to and
+        save the resulting cache status updates.
+
+        Success is only queued once a document's files are in place, so no
+        status describes outputs that are not on disk.
+        """
+        self.writer.join()
+        self._collect_landed_outputs(wait=True)
+        self._save_status_updates()
 
     def _load_from_cache(
         self, cached_entry, catalog_entries: List[Dict[str, Any]]
@@ -787,15 +1179,16 @@ class ArxivHtmlAdapterPipeline:
         try:
             doc_dir: Path = Path(cached_entry.output_dir)
             metadata_file: Path = doc_dir / "document_metadata.json"
-            chunks_dir: Path = doc_dir / "chunks"
-            if not metadata_file.exists() or not chunks_dir.exists():
+            if not has_saved_chunks(doc_dir):
                 return False
-            import json
-
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                metadata_data: Dict[str, Any] = json.load(f)
-            chunk_files: list = [f for f in chunks_dir.glob("chunk_*_metadata.json")]
-            chunk_count: int = len(chunk_files)
+            try:
+                metadata_data: Dict[str, Any] = json_loads(metadata_file.read_bytes())
+            except FileNotFoundError:
+                return False
+            chunk_count: Optional[int] = cached_entry.chunk_count
+            if chunk_count is None:
+                # Entries written before chunk counts were cached
+                chunk_count = count_saved_chunks(doc_dir)
             catalog_entry: Dict[str, Any] = {
                 "document_id": metadata_data["document_id"],
                 "title": metadata_data["title"],
@@ -810,7 +1203,7 @@ class ArxivHtmlAdapterPipeline:
             return True
         except Exception as e:
             self.metadata_manager.log(
-                "ERROR", "cache", f"Failed to load from cache: {str(e)}"
+                "ERROR", "cache", "Failed to load from cache: %s", e
             )
             return False
 
@@ -821,57 +1214,115 @@ class ArxivHtmlAdapterPipeline:
         catalog_entries: List[Dict[str, Any]],
     ) -> bool:
         """
-        Process single document through processing and chunking.
+        Process single document through processing and chunking in this process.
         """
         try:
             self.metadata_manager.log(
-                "INFO", "processing", f"Processing document: {discovered.title}"
+                "INFO", "processing", "Processing document: %s", discovered.title
             )
-            doc_dir: Path = (
-                self.output_dir / "documents" / f"arxiv_{acquired.document_id}"
+            markdown_path, proc_metadata, chunks = _convert_and_chunk(
+                self.processor,
+                self.chunker,
+                acquired,
+                self.staging_dir,
             )
-            doc_dir.mkdir(parents=True, exist_ok=True)
-
-            # Use HTML processor
-            markdown_path, proc_metadata = self.processor.process(
-                acquired, self.output_dir / "documents"
+            return self._save_document_outputs(
+                discovered,
+                acquired,
+                markdown_path,
+                proc_metadata,
+                chunks,
+                catalog_entries,
+            )
+        except Exception as e:
+            self.metadata_manager.log(
+                "ERROR", "processing", "Failed to process document: %s", e
             )
+            self.writer.discard_dir(self.staging_dir / f"arxiv_{acquired.document_id}")
+            return False
+
+    def _save_document_outputs(
+        self,
+        discovered: DiscoveredDocument,
+        acquired: AcquiredDocument,
+        markdown_path: Path,
+        proc_metadata: ProcessingMetadata,
+        chunks: Optional[List[ChunkContent]],
+        catalog_entries: List[Dict[str, Any]],
+    ) -> bool:
+        """
+        Queue processing metadata, chunks and document metadata for writing.
 
-            if not markdown_path.exists():
+        The processor has already written the markdown into this document's
+        staging directory; the rest is written there too, and the writer then
+        moves the directory into place. The catalog entry is added by
+        _collect_landed_outputs() once it has landed.
+
+        Returns:
+            True if the outputs were queued, False if processing failed
+        """
+        try:
+            if chunks is None:
                 self.metadata_manager.log(
-                    "ERROR", "processing", f"Processing failed: {discovered.title}"
+                    "ERROR", "processing", "Processing failed: %s", discovered.title
+                )
+                self.writer.discard_dir(
+                    self.staging_dir / f"arxiv_{acquired.document_id}"
                 )
                 return False
-            self.processor.save_processing_metadata(
-                proc_metadata, doc_dir / "processing_metadata.json"
+            doc_dir: Path = (
+                self.output_dir / "documents" / f"arxiv_{acquired.document_id}"
             )
-            self.metadata_manager.log(
-                "INFO", "chunking", f"Chunking document: {discovered.title}"
+            # Outputs are assembled next to the markdown in the staging directory,
+            # which the writer moves into place after its last write, so an
+            # interrupted run never leaves a partial document that looks processed
+            tmp_dir: Path = markdown_path.parent
+            if self.chunks_format != "jsonl":
+                chunks_dir: Path = tmp_dir / "chunks"
+                if chunks_dir.exists():
+                    shutil.rmtree(chunks_dir)
+                chunks_dir.mkdir()
+            ArxivHtmlProcessor.save_processing_metadata(
+                proc_metadata,
+                tmp_dir / "processing_metadata.json",
+                self.writer,
+                self.pretty_json,
             )
-            chunks: List[ChunkContent] = self.chunker.chunk(
-                markdown_path, discovered.document_id
+            ArxivChunker.save_chunks(
+                chunks, tmp_dir, self.writer, self.chunks_format, self.pretty_json
             )
-            self.chunker.save_chunks(chunks, doc_dir)
             self.metadata_manager.log(
-                "INFO", "chunking", f"Created {len(chunks)} chunks"
+                "INFO", "chunking", "Chunking document: %s", discovered.title
+            )
+            self.metadata_manager.log(
+                "INFO", "chunking", "Created %d chunks", len(chunks)
             )
             doc_metadata: DocumentMetadata = (
                 self.metadata_manager.create_document_metadata(
-                    discovered, acquired, markdown_path
+                    discovered, acquired, doc_dir / markdown_path.name
                 )
             )
             self.metadata_manager.save_document_metadata(
-                doc_metadata, doc_dir / "document_metadata.json"
+                doc_metadata,
+                tmp_dir / "document_metadata.json",
+                self.writer,
+                self.pretty_json,
             )
             catalog_entry: Dict[str, Any] = self.metadata_manager.create_catalog_entry(
                 doc_metadata, len(chunks)
             )
-            catalog_entries.append(catalog_entry)
+            landed: Future = self.writer.replace_dir(tmp_dir, doc_dir)
+            self._pending_outputs.append(
+                (landed, discovered, catalog_entry, catalog_entries)
+            )
             return True
         except Exception as e:
             self.metadata_manager.log(
-                "ERROR", "processing", f"Failed to process document: {str(e)}"
+                "ERROR", "processing", "Failed to process document: %s", e
             )
+            if chunks is not None:
+                # Drop any writes already queued for this document
+                self.writer.discard_dir(markdown_path.parent)
             return False
 
     def _save_catalog(self, entries: List[Dict[str, Any]]) -> None:
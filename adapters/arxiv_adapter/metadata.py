@@ -5,29 +5,71 @@ Creates document_metadata.json, catalog.json, and maintains processing_log.json
 according to HEPilot specification schemas.
 """
 
-import json
 import re
-from typing import List, Dict, Any, Optional
+import threading
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import UUID
 from models import DiscoveredDocument, AcquiredDocument, DocumentMetadata, LogEntry
+from utils import BackgroundWriter, atomic_write_bytes, ensure_dir, json_dumps
+
+LOG_LEVELS: Dict[str, int] = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+# (lowercase title keyword, experiment tag), checked in order
+EXPERIMENT_KEYWORDS: Tuple[Tuple[str, str], ...] = (
+    ('lhcb', 'LHCb'),
+    ('atlas', 'ATLAS'),
+    ('cms', 'CMS'),
+    ('alice', 'ALICE'),
+    ('belle', 'Belle'),
+    ('babar', 'BaBar'),
+)
+
+# (lowercase title keyword, collaboration name), checked in order
+COLLABORATION_KEYWORDS: Tuple[Tuple[str, str], ...] = (
+    ('lhcb collaboration', 'LHCb Collaboration'),
+    ('atlas collaboration', 'ATLAS Collaboration'),
+    ('cms collaboration', 'CMS Collaboration'),
+    ('alice collaboration', 'ALICE Collaboration'),
+)
+# Matches author names without lowercasing each one
+COLLABORATION_AUTHOR_PATTERN = re.compile(r'collaboration', re.IGNORECASE)
+# New-style arXiv ID anywhere in a URL
+ARXIV_ID_PATTERN = re.compile(r'(\d{4}\.\d{4,5})')
 
 
 class MetadataManager:
     """Manages metadata generation and catalog maintenance."""
     
-    def __init__(self, adapter_version: str = "1.0.0", include_authors: bool = False) -> None:
+    def __init__(
+        self,
+        adapter_version: str = "1.0.0",
+        include_authors: bool = False,
+        log_level: str = "DEBUG"
+    ) -> None:
         """
         Initialize metadata manager.
         
         Args:
             adapter_version: Version of the adapter
             include_authors: Whether to include authors in metadata
+            log_level: Minimum level recorded in the processing log
+            
+        Raises:
+            ValueError: If log_level is not one of LOG_LEVELS
         """
         self.adapter_version: str = adapter_version
         self.include_authors: bool = include_authors
+        min_log_level: Optional[int] = LOG_LEVELS.get(log_level.upper())
+        if min_log_level is None:
+            raise ValueError(
+                f"Unknown log_level {log_level!r}; expected one of {', '.join(LOG_LEVELS)}"
+            )
+        self.min_log_level: int = min_log_level
         self.log_entries: List[LogEntry] = []
+        # log() is called from the background acquisition thread too
+        self._log_lock: threading.Lock = threading.Lock()
     
     def create_document_metadata(
         self,
@@ -46,10 +88,12 @@ class MetadataManager:
         Returns:
             Document metadata object
         """
-        arxiv_id: str = self._extract_arxiv_id(discovered.source_url)
+        # Discovery already parsed the arXiv ID; only fall back to the URL
+        arxiv_id: str = discovered.arxiv_id or self._extract_arxiv_id(discovered.source_url)
         categories: List[str] = self._extract_categories(arxiv_id)
         publication_date: Optional[str] = None
-        experiment_tags: List[str] = self._detect_experiments(discovered.title)
+        title_lower: str = discovered.title.lower()
+        experiment_tags: List[str] = self._detect_experiments(title_lower)
         authors_list: Optional[List[str]] = discovered.authors if self.include_authors else None
         return DocumentMetadata(
             document_id=discovered.document_id,
@@ -66,7 +110,7 @@ class MetadataManager:
             processing_timestamp=datetime.now(timezone.utc),
             adapter_version=self.adapter_version,
             experiment_tags=experiment_tags if experiment_tags else None,
-            collaboration=self._detect_collaboration(discovered.title, discovered.authors or []),
+            collaboration=self._detect_collaboration(title_lower, discovered.authors or []),
             license="arXiv.org perpetual license",
             arxiv_id=discovered.arxiv_id,
             arxiv_version=discovered.arxiv_version
@@ -82,7 +126,7 @@ class MetadataManager:
         Returns:
             arXiv ID
         """
-        match = re.search(r'(\d{4}\.\d{4,5})', url)
+        match = ARXIV_ID_PATTERN.search(url)
         if match:
             return match.group(1)
         return "unknown"
@@ -99,64 +143,52 @@ class MetadataManager:
         """
         return ["hep-ex"]
     
-    def _detect_experiments(self, title: str) -> List[str]:
+    def _detect_experiments(self, title_lower: str) -> List[str]:
         """
         Detect HEP experiments mentioned in title.
         
         Args:
-            title: Document title
+            title_lower: Lowercased document title
             
         Returns:
             List of experiment tags
         """
-        experiments: Dict[str, str] = {
-            'lhcb': 'LHCb',
-            'atlas': 'ATLAS',
-            'cms': 'CMS',
-            'alice': 'ALICE',
-            'belle': 'Belle',
-            'babar': 'BaBar',
-        }
-        title_lower: str = title.lower()
-        detected: List[str] = []
-        for key, value in experiments.items():
-            if key in title_lower:
-                detected.append(value)
-        return detected
+        return [tag for keyword, tag in EXPERIMENT_KEYWORDS if keyword in title_lower]
     
-    def _detect_collaboration(self, title: str, authors: List[str]) -> Optional[str]:
+    def _detect_collaboration(self, title_lower: str, authors: List[str]) -> Optional[str]:
         """
         Detect collaboration from title or authors.
         
         Args:
-            title: Document title
+            title_lower: Lowercased document title
             authors: List of authors
             
         Returns:
             Collaboration name or None
         """
-        collaborations: List[str] = [
-            'LHCb Collaboration',
-            'ATLAS Collaboration',
-            'CMS Collaboration',
-            'ALICE Collaboration',
-        ]
-        title_lower: str = title.lower()
-        for collab in collaborations:
-            if collab.lower() in title_lower:
+        for keyword, collab in COLLABORATION_KEYWORDS:
+            if keyword in title_lower:
                 return collab
         for author in authors:
-            if 'collaboration' in author.lower():
+            if COLLABORATION_AUTHOR_PATTERN.search(author):
                 return author
         return None
     
-    def save_document_metadata(self, metadata: DocumentMetadata, output_path: Path) -> None:
+    def save_document_metadata(
+        self,
+        metadata: DocumentMetadata,
+        output_path: Path,
+        writer: Optional[BackgroundWriter] = None,
+        indent: bool = True
+    ) -> None:
         """
         Save document metadata to JSON file.
         
         Args:
             metadata: Document metadata
             output_path: Path to output JSON file
+            writer: Optional background writer; the file is written inline without one
+            indent: Pretty-print with 2-space indentation; False writes compact JSON
         """
         data: Dict[str, Any] = {
             k: v for k, v in {
@@ -180,9 +212,12 @@ class MetadataManager:
                 "arxiv_version": metadata.arxiv_version
             }.items() if v is not None
         }
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        ensure_dir(output_path.parent)
+        data_bytes: bytes = json_dumps(data, indent)
+        if writer is not None:
+            writer.write(output_path, data_bytes)
+        else:
+            output_path.write_bytes(data_bytes)
     
     def create_catalog_entry(self, metadata: DocumentMetadata, chunk_count: int) -> Dict[str, Any]:
         """
@@ -218,20 +253,46 @@ class MetadataManager:
             "document_count": len(entries),
             "documents": entries
         }
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(catalog_data, f, indent=2)
+        ensure_dir(output_path.parent)
+        atomic_write_bytes(output_path, json_dumps(catalog_data))
+    
+    def is_enabled(self, level: str) -> bool:
+        """
+        Check whether entries of a log level are recorded.
+        
+        Args:
+            level: Log level (DEBUG, INFO, WARNING, ERROR)
+            
+        Returns:
+            True if entries at this level are kept
+        """
+        return LOG_LEVELS.get(level, 40) >= self.min_log_level
     
-    def log(self, level: str, component: str, message: str, context: Optional[Dict[str, Any]] = None) -> None:
+    def log(
+        self,
+        level: str,
+        component: str,
+        message: str,
+        *args: Any,
+        context: Optional[Dict[str, Any]] = None
+    ) -> None:
         """
         Add structured log entry.
         
+        Like the stdlib logging module, %-style arguments are only interpolated
+        into the message when the level is enabled.
+        
         Args:
             level: Log level (DEBUG, INFO, WARNING, ERROR)
             component: Component name
-            message: Log message
+            message: Log message, optionally with %-style placeholders
+            *args: Values for the message placeholders
             context: Additional context data
         """
+        if not self.is_enabled(level):
+            return
+        if args:
+            message = message % args
         entry: LogEntry = LogEntry(
             timestamp=datetime.now(timezone.utc),
             level=level,
@@ -239,7 +300,8 @@ class MetadataManager:
             message=message,
             context=context
         )
-        self.log_entries.append(entry)
+        with self._log_lock:
+            self.log_entries.append(entry)
     
     def save_log(self, output_path: Path) -> None:
         """
@@ -248,6 +310,8 @@ class MetadataManager:
         Args:
             output_path: Path to processing_log.json
         """
+        with self._log_lock:
+            entries: List[LogEntry] = list(self.log_entries)
         log_data: List[Dict[str, Any]] = [
             {
                 "timestamp": entry.timestamp.isoformat(),
@@ -256,8 +320,7 @@ class MetadataManager:
                 "message": entry.message,
                 "context": entry.context
             }
-            for entry in self.log_entries
+            for entry in entries
         ]
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(log_data, f, indent=2)
+        ensure_dir(output_path.parent)
+        atomic_write_bytes(output_path, json_dumps(log_data))
@@ -5,6 +5,7 @@ This module defines typed data structures for each pipeline stage,
 ensuring type safety and schema compliance.
 """
 
+from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel, Field
@@ -23,8 +24,15 @@ class AdapterConfig(BaseModel):
     config_hash: str
 
 
-class DiscoveredDocument(BaseModel):
-    """Discovered document from arXiv API."""
+@dataclass(slots=True, kw_only=True)
+class DiscoveredDocument:
+    """
+    Discovered document from arXiv API.
+
+    A plain slotted dataclass rather than a pydantic model: one is built per
+    search result from fields discovery has already parsed, so validation is
+    skipped. Fields are keyword-only, like the pydantic model's were.
+    """
 
     document_id: UUID
     source_type: str = "arxiv"
@@ -64,8 +72,14 @@ class ProcessingMetadata(BaseModel):
     conversion_warnings: List[str] = Field(default_factory=list)
 
 
-class ChunkContent(BaseModel):
-    """Individual chunk with metadata."""
+@dataclass(slots=True)
+class ChunkContent:
+    """
+    Individual chunk with metadata.
+
+    A plain slotted dataclass rather than a pydantic model: one is built per
+    chunk and every field is produced by the chunker, so validation is skipped.
+    """
 
     chunk_id: UUID
     document_id: UUID
@@ -78,6 +92,7 @@ class ChunkContent(BaseModel):
     has_overlap_previous: bool = False
     has_overlap_next: bool = False
     content_features: Optional[Dict[str, int]] = None
+    character_count: int = 0
 
 
 class DocumentMetadata(BaseModel):
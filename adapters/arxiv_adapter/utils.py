@@ -4,9 +4,29 @@ Utility functions for the ArXiv HTML adapter.
 Provides colored output, validation helpers, and common utilities.
 """
 
-from typing import Optional
+import functools
+import os
+import queue
+import shutil
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
 from pathlib import Path
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+
+    ORJSON_AVAILABLE = False
+
+# Single-file chunk output ("jsonl" chunks_format), one chunk per line
+CHUNKS_JSONL_NAME: str = "chunks.jsonl"
+# Suffix of a directory moved aside while its replacement is moved in
+REPLACED_DIR_SUFFIX: str = ".old"
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -153,7 +173,8 @@ def validate_html_exists(html_path: Path) -> bool:
         True if file exists and is valid
     """
     try:
-        if not html_path.exists() or html_path.stat().st_size == 0:
+        # stat() raises for a missing file, which is caught below
+        if html_path.stat().st_size == 0:
             return False
 
         # Basic content check
@@ -177,3 +198,296 @@ def get_html_path(output_dir: Path, document_id: str) -> Path:
         Path to HTML file
     """
     return output_dir / "downloads" / f"{document_id}.html"
+
+
+def _json_default(value: Any) -> str:
+    """Serialize the non-JSON types orjson handles natively (datetime, UUID)."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def json_dumps(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes with orjson, or the stdlib without it.
+
+    Args:
+        data: Value to serialize
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        Encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        text: str = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+    else:
+        text = json.dumps(
+            data, separators=(",", ":"), ensure_ascii=False, default=_json_default
+        )
+    return text.encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes with orjson, or the stdlib without it.
+
+    Args:
+        data: Encoded JSON
+
+    Returns:
+        Parsed value
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def has_saved_chunks(doc_dir: Path) -> bool:
+    """
+    Check whether a document directory holds chunk output in either format.
+
+    Args:
+        doc_dir: Per-document output directory
+
+    Returns:
+        True if chunks.jsonl or at least one chunk file exists
+    """
+    if (doc_dir / CHUNKS_JSONL_NAME).is_file():
+        return True
+    chunks_dir: Path = doc_dir / "chunks"
+    return chunks_dir.is_dir() and any(chunks_dir.glob("chunk_*.md"))
+
+
+def count_saved_chunks(doc_dir: Path) -> int:
+    """
+    Count the chunks saved in a document directory in either format.
+
+    Args:
+        doc_dir: Per-document output directory
+
+    Returns:
+        Number of saved chunks
+    """
+    jsonl_path: Path = doc_dir / CHUNKS_JSONL_NAME
+    if jsonl_path.is_file():
+        with open(jsonl_path, "rb") as f:
+            return sum(1 for line in f if line.strip())
+    chunks_dir: Path = doc_dir / "chunks"
+    if not chunks_dir.is_dir():
+        return 0
+    return sum(
+        1
+        for entry in os.scandir(chunks_dir)
+        if entry.name.startswith("chunk_") and entry.name.endswith("_metadata.json")
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def ensure_dir(path: Path) -> None:
+    """
+    Create a directory (and parents) once per process.
+
+    Repeated calls for the same path, such as the several writers of one
+    document's outputs, skip the mkdir syscalls. Directories removed during
+    the run are not recreated.
+
+    Args:
+        path: Directory to create
+    """
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write a file atomically by writing a sibling temp file and renaming it.
+
+    Readers never observe a partially written file, and an interrupted run
+    leaves the previous version in place.
+
+    Args:
+        path: Destination file
+        data: Complete file contents
+    """
+    tmp_path: Path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """
+    Write a whole file with raw os.open/os.write/os.close.
+
+    Skips the buffered file object Path.write_bytes() builds per call, which
+    matters for the many small chunk files written per document.
+    """
+    fd: int = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view: memoryview = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _replace_dir(src: Path, dst: Path) -> None:
+    """
+    Replace directory dst with src.
+
+    The old dst is renamed aside, src is renamed into place and only then is
+    the old copy deleted, so dst is never removed before its replacement is
+    ready. A crash in between leaves the old copy under REPLACED_DIR_SUFFIX
+    for restore_replaced_dirs() to put back.
+    """
+    old: Path = dst.with_name(dst.name + REPLACED_DIR_SUFFIX)
+    if old.exists():
+        shutil.rmtree(old)
+    try:
+        os.replace(dst, old)
+    except FileNotFoundError:
+        os.replace(src, dst)
+        return
+    try:
+        os.replace(src, dst)
+    except BaseException:
+        os.replace(old, dst)
+        raise
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def restore_replaced_dirs(parent: Path) -> None:
+    """
+    Clean up after directory replacements interrupted by a crash.
+
+    An old copy whose replacement never landed is renamed back into place;
+    one whose replacement did land is deleted.
+
+    Args:
+        parent: Directory holding the replaced directories
+    """
+    try:
+        with os.scandir(parent) as entries:
+            names: set = {entry.name for entry in entries}
+    except FileNotFoundError:
+        return
+    for name in names:
+        if not name.endswith(REPLACED_DIR_SUFFIX):
+            continue
+        dst_name: str = name[: -len(REPLACED_DIR_SUFFIX)]
+        if dst_name in names:
+            shutil.rmtree(parent / name, ignore_errors=True)
+        else:
+            os.replace(parent / name, parent / dst_name)
+
+
+class BackgroundWriter:
+    """
+    Writes files on a single background thread.
+
+    Callers queue complete file contents and carry on with CPU-bound work
+    while the writes happen. The queue is bounded, so a producer that outruns
+    the disk blocks in write() instead of buffering unbounded output in
+    memory. Operations run in the order they were queued, so a directory
+    queued with replace_dir() is only moved after the writes into it.
+
+    Failures are reported per directory: replace_dir() returns a Future that
+    fails with the first error among the writes queued since the previous
+    replace_dir() (the directory is then left unmoved) or with the error of
+    the move itself. One document's failure does not affect the others.
+    """
+
+    def __init__(self, max_pending: int = 1024) -> None:
+        """
+        Start the writer thread.
+
+        Args:
+            max_pending: Maximum number of queued writes before write() blocks
+        """
+        self._queue: "queue.Queue[Callable[[], object]]" = queue.Queue(maxsize=max_pending)
+        # First failed write since the last replace_dir(); writer thread only
+        self._write_error: Optional[BaseException] = None
+        self._thread: threading.Thread = threading.Thread(
+            target=self._run, name="output-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, path: Path, data: bytes) -> None:
+        """
+        Queue a file write, blocking while the queue is full.
+
+        Args:
+            path: Destination file (its directory must already exist)
+            data: Complete file contents
+        """
+        self._queue.put(functools.partial(self._write, path, data))
+
+    def replace_dir(self, src: Path, dst: Path) -> "Future[None]":
+        """
+        Queue moving a fully written directory into place, replacing dst.
+
+        Args:
+            src: Directory holding the new contents
+            dst: Final directory path
+
+        Returns:
+            Future that completes once dst holds the new contents, or fails
+            if a write into src or the move failed
+        """
+        landed: "Future[None]" = Future()
+        self._queue.put(functools.partial(self._replace_dir, src, dst, landed))
+        return landed
+
+    def discard_dir(self, src: Path) -> None:
+        """
+        Queue deleting a directory abandoned before replace_dir() was queued.
+
+        Errors from the writes into it are dropped rather than reported for
+        the next directory.
+
+        Args:
+            src: Directory to delete
+        """
+        self._queue.put(functools.partial(self._discard_dir, src))
+
+    def join(self) -> None:
+        """Block until all queued operations are done."""
+        self._queue.join()
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """Write a file, recording the error for the next replace_dir()."""
+        if self._write_error is not None:
+            return
+        try:
+            _write_file(path, data)
+        except BaseException as e:
+            self._write_error = e
+
+    def _replace_dir(self, src: Path, dst: Path, landed: "Future[None]") -> None:
+        """Move src into place unless a write into it failed, settling landed."""
+        error: Optional[BaseException] = self._write_error
+        self._write_error = None
+        if error is None:
+            try:
+                _replace_dir(src, dst)
+            except BaseException as e:
+                error = e
+        if error is not None:
+            shutil.rmtree(src, ignore_errors=True)
+            landed.set_exception(error)
+        else:
+            landed.set_result(None)
+
+    def _discard_dir(self, src: Path) -> None:
+        """Delete an abandoned directory, forgetting errors from writes into it."""
+        self._write_error = None
+        shutil.rmtree(src, ignore_errors=True)
+
+    def _run(self) -> None:
+        """Writer thread loop."""
+        while True:
+            operation: Callable[[], object] = self._queue.get()
+            try:
+                operation()
+            finally:
+                self._queue.task_done()